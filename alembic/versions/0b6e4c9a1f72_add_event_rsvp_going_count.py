@@ -0,0 +1,64 @@
+"""Add trigger-maintained going RSVP count to events
+
+Revision ID: 0b6e4c9a1f72
+Revises: f3a8b6d20c19
+Create Date: 2026-10-15 12:31:07.204658
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6e4c9a1f72'
+down_revision: Union[str, None] = 'f3a8b6d20c19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'events',
+        sa.Column('rsvp_going_count', sa.Integer(), server_default='0', nullable=False)
+    )
+    
+    # Backfill from existing RSVPs
+    op.execute("""
+        UPDATE events e SET rsvp_going_count = c.going
+        FROM (
+            SELECT event_id, count(*) AS going FROM rsvps
+            WHERE status = 'going' GROUP BY event_id
+        ) c
+        WHERE c.event_id = e.id
+    """)
+    
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_rsvp_going_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                IF OLD.status = 'going' THEN
+                    UPDATE events SET rsvp_going_count = rsvp_going_count - 1 WHERE id = OLD.event_id;
+                END IF;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                IF NEW.status = 'going' THEN
+                    UPDATE events SET rsvp_going_count = rsvp_going_count + 1 WHERE id = NEW.event_id;
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER rsvps_going_count
+        AFTER INSERT OR DELETE OR UPDATE OF status, event_id ON rsvps
+        FOR EACH ROW EXECUTE FUNCTION bump_rsvp_going_count()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS rsvps_going_count ON rsvps")
+    op.execute("DROP FUNCTION IF EXISTS bump_rsvp_going_count()")
+    op.drop_column('events', 'rsvp_going_count')
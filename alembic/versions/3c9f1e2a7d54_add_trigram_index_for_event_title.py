@@ -0,0 +1,33 @@
+"""Add trigram index for event title substring search
+
+Revision ID: 3c9f1e2a7d54
+Revises: b410c0c51217
+Create Date: 2026-10-15 09:12:03.418227
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9f1e2a7d54'
+down_revision: Union[str, None] = 'b410c0c51217'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram operators let GIN answer LIKE '%term%' queries the tsvector index cannot
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    # Index lower(title) to match the case-insensitive title filter
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY idx_event_title_trgm ON events USING GIN (lower(title) gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    # Drop the trigram index (the extension may be used elsewhere, so keep it)
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_event_title_trgm")
@@ -0,0 +1,46 @@
+"""Add stored search_tsv column for event full-text search
+
+Revision ID: 5d2a9f7e3b48
+Revises: 0b6e4c9a1f72
+Create Date: 2026-10-15 12:54:36.918240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2a9f7e3b48'
+down_revision: Union[str, None] = '0b6e4c9a1f72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR = "to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(description, ''))"
+
+
+def upgrade() -> None:
+    # Adding a stored generated column rewrites the events table once
+    op.add_column(
+        'events',
+        sa.Column('search_tsv', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True))
+    )
+    
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY idx_event_search_tsv ON events USING gin (search_tsv)"
+        )
+        # Superseded by the index on the stored column
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_event_search")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY idx_event_search ON events USING gin ({SEARCH_VECTOR})"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_event_search_tsv")
+    
+    op.drop_column('events', 'search_tsv')
@@ -37,7 +37,6 @@ def upgrade() -> None:
         sa.Column('role', sa.Enum('user', 'organizer', 'admin', name='roleenum'), nullable=False, server_default='user'),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now())
     )
-    op.create_index('ix_users_email', 'users', ['email'])
     
     # Create events table
     op.create_table(
@@ -51,9 +50,6 @@ def upgrade() -> None:
         sa.Column('created_by', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=False),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now())
     )
-    op.create_index('idx_event_date', 'events', ['starts_at'])
-    op.create_index('idx_event_organizer', 'events', ['created_by'])
-    op.create_index('idx_event_created_at', 'events', ['created_at'])
     
     # Create rsvps table
     op.create_table(
@@ -64,9 +60,17 @@ def upgrade() -> None:
         sa.Column('status', sa.Enum('going', 'interested', 'cancelled', name='rsvpstatusenum'), nullable=False, server_default='going'),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now())
     )
-    op.create_index('idx_rsvp_user', 'rsvps', ['user_id'])
-    op.create_index('idx_rsvp_event', 'rsvps', ['event_id'])
     op.create_unique_constraint('uq_user_event_rsvp', 'rsvps', ['user_id', 'event_id'])
+    
+    # Build indexes concurrently so they never block writes.
+    # CONCURRENTLY cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_email', 'users', ['email'], postgresql_concurrently=True)
+        op.create_index('idx_event_date', 'events', ['starts_at'], postgresql_concurrently=True)
+        op.create_index('idx_event_organizer', 'events', ['created_by'], postgresql_concurrently=True)
+        op.create_index('idx_event_created_at', 'events', ['created_at'], postgresql_concurrently=True)
+        op.create_index('idx_rsvp_user', 'rsvps', ['user_id'], postgresql_concurrently=True)
+        op.create_index('idx_rsvp_event', 'rsvps', ['event_id'], postgresql_concurrently=True)
 
 
 def downgrade() -> None:
@@ -0,0 +1,42 @@
+"""Add composite indexes for event listing
+
+Revision ID: 8e4b7d0c2f61
+Revises: 3c9f1e2a7d54
+Create Date: 2026-10-15 10:03:47.552190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b7d0c2f61'
+down_revision: Union[str, None] = '3c9f1e2a7d54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Event lists are ordered by (created_at DESC, id DESC); putting the filter
+    # column first lets one index scan return filtered rows already sorted.
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY idx_event_org_created ON events (created_by, created_at DESC)")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY idx_event_cat_created ON events (category, created_at DESC) "
+            "WHERE category IS NOT NULL"
+        )
+        # Also serves keyset pagination on (created_at, id) without a sort
+        op.execute("CREATE INDEX CONCURRENTLY idx_event_created_id ON events (created_at DESC, id DESC)")
+        
+        # created_by lookups are covered by the leading column of idx_event_org_created
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_event_organizer")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_organizer ON events (created_by)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_event_created_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_event_cat_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_event_org_created")
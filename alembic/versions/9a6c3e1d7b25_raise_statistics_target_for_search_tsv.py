@@ -0,0 +1,29 @@
+"""Raise statistics target for the event search_tsv column
+
+Revision ID: 9a6c3e1d7b25
+Revises: 5d2a9f7e3b48
+Create Date: 2026-10-15 18:02:11.406318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a6c3e1d7b25'
+down_revision: Union[str, None] = '5d2a9f7e3b48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Searches match search_tsv, so its lexeme statistics drive the @@ estimate
+    op.execute("ALTER TABLE events ALTER COLUMN search_tsv SET STATISTICS 1000")
+    op.execute("ANALYZE events")
+
+
+def downgrade() -> None:
+    # -1 restores the default_statistics_target
+    op.execute("ALTER TABLE events ALTER COLUMN search_tsv SET STATISTICS -1")
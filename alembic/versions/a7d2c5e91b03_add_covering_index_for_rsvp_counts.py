@@ -0,0 +1,32 @@
+"""Add covering index for RSVP counts
+
+Revision ID: a7d2c5e91b03
+Revises: 8e4b7d0c2f61
+Create Date: 2026-10-15 10:41:19.086532
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d2c5e91b03'
+down_revision: Union[str, None] = '8e4b7d0c2f61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covering index: counting going RSVPs per event needs no heap access
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY idx_rsvp_event_status ON rsvps (event_id, status) "
+            "INCLUDE (user_id)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_rsvp_event_status")
@@ -30,12 +30,14 @@ def upgrade() -> None:
     # Add category column to events table
     op.execute("ALTER TABLE events ADD COLUMN category eventcategory")
     
-    # Create index on category for filtering
-    op.execute("CREATE INDEX idx_event_category ON events (category)")
+    # Create index on category for filtering, concurrently so writes are not blocked
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY idx_event_category ON events (category)")
 
 
 def downgrade() -> None:
     # Drop the index and column
-    op.execute("DROP INDEX IF EXISTS idx_event_category")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_event_category")
     op.execute("ALTER TABLE events DROP COLUMN IF EXISTS category")
     op.execute("DROP TYPE IF EXISTS eventcategory")
@@ -0,0 +1,31 @@
+"""Raise statistics target for event search columns
+
+Revision ID: d51f0a8c6e27
+Revises: a7d2c5e91b03
+Create Date: 2026-10-15 11:26:52.730114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd51f0a8c6e27'
+down_revision: Union[str, None] = 'a7d2c5e91b03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Finer statistics help the planner estimate full-text selectivity
+    op.execute("ALTER TABLE events ALTER COLUMN title SET STATISTICS 1000")
+    op.execute("ALTER TABLE events ALTER COLUMN description SET STATISTICS 1000")
+    op.execute("ANALYZE events")
+
+
+def downgrade() -> None:
+    # -1 restores the default_statistics_target
+    op.execute("ALTER TABLE events ALTER COLUMN description SET STATISTICS -1")
+    op.execute("ALTER TABLE events ALTER COLUMN title SET STATISTICS -1")
@@ -19,13 +19,16 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Create GIN index for full-text search on events table
-    op.execute("""
-        CREATE INDEX idx_event_search ON events 
-        USING GIN (to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(description, '')))
-    """)
+    # Create GIN index for full-text search on events table.
+    # CONCURRENTLY avoids blocking writes but cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY idx_event_search ON events 
+            USING GIN (to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(description, '')))
+        """)
 
 
 def downgrade() -> None:
     # Drop the full-text search index
-    op.execute("DROP INDEX IF EXISTS idx_event_search")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_event_search")
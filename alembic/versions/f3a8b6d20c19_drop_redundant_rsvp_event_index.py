@@ -0,0 +1,29 @@
+"""Drop redundant RSVP event index
+
+Revision ID: f3a8b6d20c19
+Revises: d51f0a8c6e27
+Create Date: 2026-10-15 12:08:44.517203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8b6d20c19'
+down_revision: Union[str, None] = 'd51f0a8c6e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # idx_rsvp_event_status leads with event_id, so this index only costs writes
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_rsvp_event")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY idx_rsvp_event ON rsvps (event_id)")
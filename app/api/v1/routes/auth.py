@@ -1,30 +1,34 @@
 """Authentication routes for user registration, login, logout, and token management."""
+from typing import Tuple
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.schemas import UserCreate, UserOut, Token, TokenResponse, LoginRequest, RefreshTokenRequest
 from app.services.auth_service import AuthService
 from app.db.session import get_session
-from app.db.models.user import User
-from app.auth import get_current_user
+from app.auth import AuthUser, get_current_user, get_authed
 from sqlalchemy.ext.asyncio import AsyncSession
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from app.core.rate_limit import limiter
 
 router = APIRouter(prefix="/auth", tags=["auth"])
-limiter = Limiter(key_func=get_remote_address)
-security = HTTPBearer()
 
-def get_auth_service(session: AsyncSession = Depends(get_session)) -> AuthService:
+def get_auth_service(request: Request, session: AsyncSession = Depends(get_session)) -> AuthService:
     """
     Dependency injection for AuthService.
     
+    The instance is stored on the request state so every dependency in the
+    same request shares one service.
+    
     Args:
+        request: Current request
         session: Database session
         
     Returns:
         AuthService instance
     """
-    return AuthService(session)
+    service = getattr(request.state, "auth_service", None)
+    if service is None:
+        service = AuthService(session)
+        request.state.auth_service = service
+    return service
 
 @router.post("/register", response_model=UserOut)
 @limiter.limit("3/minute")
@@ -104,20 +108,20 @@ async def refresh_access_token(
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    current_user: User = Depends(get_current_user),
+    authed: Tuple[AuthUser, str] = Depends(get_authed),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """
     Logout user by revoking their current token.
     Requires valid access token in Authorization header.
     """
-    await auth_service.logout(credentials.credentials)
+    _, token = authed
+    await auth_service.logout(token)
     return None
 
 
 @router.get("/me", response_model=UserOut)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: AuthUser = Depends(get_current_user)):
     """
     Get current user information from JWT token.
     
@@ -1,16 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from app.schemas import EventCreate, EventOut, EventCategory, PaginatedResponse, PaginationMetadata
 from app.db.session import get_session
 from app.services.event_service import EventService
 from app.auth import get_current_user, role_required
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import Any, List, Optional
 from datetime import datetime
+import orjson
+import xxhash
 
 router = APIRouter(prefix="/events", tags=["events"])
 
-def get_event_service(session: AsyncSession = Depends(get_session)) -> EventService:
-    return EventService(session)
+# Lets browsers/CDNs reuse public event reads briefly and revalidate via ETag
+EVENTS_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=60"
+
+# Fields exposed by EventOut; cached event dicts also carry created_at
+_EVENT_OUT_FIELDS = tuple(EventOut.model_fields)
+
+def _event_out(event: dict) -> dict:
+    """
+    Project a cached event dict onto the EventOut shape.
+    The repository already emits JSON-safe values, so no re-validation is needed.
+    """
+    return {field: event.get(field) for field in _EVENT_OUT_FIELDS}
+
+def _etag_response(request: Request, content: Any) -> Response:
+    """
+    Serialize JSON-safe content with ETag and Cache-Control headers.
+    Returns 304 Not Modified when the client already holds the same body.
+    """
+    body = orjson.dumps(content)
+    etag = f'"{xxhash.xxh3_64_hexdigest(body)}"'
+    headers = {"ETag": etag, "Cache-Control": EVENTS_CACHE_CONTROL}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_tags or "*" in client_tags:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def get_event_service(request: Request, session: AsyncSession = Depends(get_session)) -> EventService:
+    # One service per request, shared by any dependency that asks for it
+    service = getattr(request.state, "event_service", None)
+    if service is None:
+        service = EventService(session)
+        request.state.event_service = service
+    return service
 
 @router.post("/", response_model=EventOut)
 async def create_event_endpoint(
@@ -23,6 +60,7 @@ async def create_event_endpoint(
 
 @router.get("/", response_model=PaginatedResponse[EventOut])
 async def get_events(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     per_page: int = Query(20, ge=1, le=100, description="Number of items per page"),
     created_by: Optional[str] = Query(None, description="Filter by organizer user ID"),
@@ -30,6 +68,7 @@ async def get_events(
     starts_before: Optional[datetime] = Query(None, description="Filter events starting before this datetime"),
     search: Optional[str] = Query(None, description="Search in event title and description"),
     category: Optional[EventCategory] = Query(None, description="Filter by event category"),
+    title: Optional[str] = Query(None, description="Filter by case-insensitive substring of the event title"),
     event_service: EventService = Depends(get_event_service)
 ):
     """
@@ -41,6 +80,7 @@ async def get_events(
     - starts_before: Filter events starting before this datetime (ISO format)
     - search: Full-text search in event title and description
     - category: Filter by event category (technology, business, arts, sports, etc.)
+    - title: Case-insensitive substring match on the event title
     """
     # Calculate skip/offset from page number
     skip = (page - 1) * per_page
@@ -54,29 +94,34 @@ async def get_events(
         starts_before=starts_before,
         search=search,
         category=category.value if category else None,
+        title_contains=title,
     )
     
     # Calculate pagination metadata
     total_pages = (total_count + per_page - 1) // per_page  # Ceiling division
     
-    return PaginatedResponse(
-        items=events,
-        pagination=PaginationMetadata(
-            total=total_count,
-            page=page,
-            per_page=per_page,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1
-        )
+    # Hand-serialized: validating every row through EventOut dominates handler CPU
+    pagination = PaginationMetadata(
+        total=total_count,
+        page=page,
+        per_page=per_page,
+        total_pages=total_pages,
+        has_next=page < total_pages,
+        has_prev=page > 1
     )
+    response = {
+        "items": [_event_out(ev) for ev in events],
+        "pagination": pagination.model_dump(),
+    }
+    return _etag_response(request, response)
 
 @router.get("/{event_id}", response_model=EventOut)
 async def get_event_detail(
+    request: Request,
     event_id: str,
     event_service: EventService = Depends(get_event_service)
 ):
     ev = await event_service.get_event(event_id)
     if not ev:
         raise HTTPException(status_code=404, detail="Event not found")
-    return ev
+    return _etag_response(request, _event_out(ev))
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from app.schemas import RSVPCreate, RSVPOut
 from app.db.session import get_session
 from app.services.rsvp_service import RSVPService
@@ -8,8 +8,13 @@ from uuid import UUID
 
 router = APIRouter(prefix="/rsvps", tags=["rsvps"])
 
-def get_rsvp_service(session: AsyncSession = Depends(get_session)) -> RSVPService:
-    return RSVPService(session)
+def get_rsvp_service(request: Request, session: AsyncSession = Depends(get_session)) -> RSVPService:
+    # One service per request, shared by any dependency that asks for it
+    service = getattr(request.state, "rsvp_service", None)
+    if service is None:
+        service = RSVPService(session)
+        request.state.rsvp_service = service
+    return service
 
 @router.post("/", response_model=RSVPOut)
 async def create_rsvp_endpoint(
@@ -1,36 +1,215 @@
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from itertools import chain
+from typing import Optional, Tuple
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.db.session import get_session
+from sqlalchemy import event, inspect
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.db.models.user import User
+from sqlalchemy.orm import Session
+from app.db.models.user import User, RoleEnum
 from app.core.security import decode_token, is_token_revoked, validate_password, verify_password, create_access_token
+from app.cache.local_cache import LocalTTLCache
+from app.cache.redis_client import cache
+from app.core.logging import logger
 
 # Use HTTPBearer for JWT token authentication instead of OAuth2PasswordBearer
 # This will show a simple "Authorize" button in Swagger UI where you can paste your JWT token
 security = HTTPBearer()
 
 
-async def get_current_user(
+@dataclass(frozen=True)
+class AuthUser:
+    """
+    Immutable snapshot of the authenticated user.
+    
+    This is what get_authed caches and returns instead of the ORM instance,
+    so nothing tied to one request's session is shared with another.
+    """
+    id: UUID
+    email: str
+    full_name: Optional[str]
+    role: RoleEnum
+    
+    @classmethod
+    def from_user(cls, user: User) -> "AuthUser":
+        """Copy the fields routes rely on out of a loaded User."""
+        return cls(id=user.id, email=user.email, full_name=user.full_name, role=user.role)
+
+
+# Short-lived per-process cache of AuthUser snapshots keyed by token hash.
+# Lets repeat requests with the same token skip the Redis revocation check
+# and the user SELECT. Revocations and user changes are broadcast over
+# REVOCATION_CHANNEL so every worker evicts at once; the TTL only bounds
+# staleness when that feed is unavailable.
+_user_cache = LocalTTLCache(maxsize=10_000, ttl=30)
+
+# Redis pub/sub channel carrying token cache keys revoked on any worker,
+# or "user:<id>" when all of one user's tokens must be evicted
+REVOCATION_CHANNEL = "auth:revoked_tokens"
+USER_MESSAGE_PREFIX = "user:"
+
+# User columns copied into AuthUser; a committed change to any of them
+# (or deleting the user) evicts that user's cached snapshots
+_SNAPSHOT_FIELDS = ("email", "full_name", "role")
+_CHANGED_USERS_KEY = "auth_changed_users"
+
+# Keeps fire-and-forget publish tasks referenced until they finish
+_publish_tasks = set()
+
+# Bumped on every local eviction. get_authed reads it before checking the
+# token and skips caching if it moved, so an eviction that lands while a
+# lookup is in flight cannot be undone by that lookup's result.
+_eviction_generation = 0
+
+
+def token_cache_key(token: str) -> str:
+    """Hash a raw token into a compact cache key."""
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def _evict_token_key(cache_key: str) -> None:
+    """Drop one token's snapshot cached in this process."""
+    global _eviction_generation
+    _eviction_generation += 1
+    _user_cache.pop(cache_key)
+
+
+def _evict_user(user_id: UUID) -> None:
+    """Drop every snapshot of a user cached in this process."""
+    global _eviction_generation
+    _eviction_generation += 1
+    _user_cache.pop_where(lambda authed: authed.id == user_id)
+
+
+def _evict_all() -> None:
+    """Drop every snapshot cached in this process."""
+    global _eviction_generation
+    _eviction_generation += 1
+    _user_cache.clear()
+
+
+async def forget_token(token: str) -> None:
+    """Drop any cached user for a token on every worker (e.g. after logout)."""
+    cache_key = token_cache_key(token)
+    _evict_token_key(cache_key)
+    await cache.publish(REVOCATION_CHANNEL, cache_key)
+
+
+async def forget_user(user_id: UUID) -> None:
+    """
+    Drop every cached snapshot of a user on every worker.
+    
+    Called automatically once a change to the user's role or profile is
+    committed, so permission changes apply to the next request.
+    
+    Args:
+        user_id: ID of the changed user
+    """
+    _evict_user(user_id)
+    await cache.publish(REVOCATION_CHANNEL, f"{USER_MESSAGE_PREFIX}{user_id}")
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:
+    # Attribute history is still available here; it is reset after the flush
+    for obj in chain(session.dirty, session.deleted):
+        if not isinstance(obj, User):
+            continue
+        state = inspect(obj)
+        if obj in session.deleted or any(
+            state.attrs[field].history.has_changes() for field in _SNAPSHOT_FIELDS
+        ):
+            session.info.setdefault(_CHANGED_USERS_KEY, set()).add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_changed_users(session: Session) -> None:
+    # Evict only once committed; get_authed's generation check stops a lookup
+    # that read the old row from re-caching it
+    user_ids = session.info.pop(_CHANGED_USERS_KEY, ())
+    for user_id in user_ids:
+        _evict_user(user_id)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Plain synchronous session (e.g. a script); no workers to notify
+            continue
+        task = loop.create_task(cache.publish(REVOCATION_CHANNEL, f"{USER_MESSAGE_PREFIX}{user_id}"))
+        _publish_tasks.add(task)
+        task.add_done_callback(_publish_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop(_CHANGED_USERS_KEY, None)
+
+
+async def listen_for_revocations() -> None:
+    """
+    Evict entries from the local user cache as workers announce revocations.
+    
+    Runs for the lifetime of the process. Whenever the subscription is
+    (re)established the cache is cleared, since announcements made while
+    disconnected were missed.
+    """
+    while True:
+        pubsub = cache.pubsub()
+        try:
+            await pubsub.subscribe(REVOCATION_CHANNEL)
+            _evict_all()
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    data = message["data"].decode()
+                    if data.startswith(USER_MESSAGE_PREFIX):
+                        _evict_user(UUID(data[len(USER_MESSAGE_PREFIX):]))
+                    else:
+                        _evict_token_key(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Token revocation feed error: {e}")
+            _evict_all()
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
+
+
+async def get_authed(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     session: AsyncSession = Depends(get_session)
-) -> User:
+) -> Tuple[AuthUser, str]:
     """
-    Get current user from JWT token with revocation check.
+    Authenticate the request once and return both the user and the raw token.
+    
+    Routes that need the token (e.g. logout) depend on this directly; all
+    other routes use get_current_user. FastAPI caches dependencies per
+    request, so the header is parsed and the token verified only once.
     
     Args:
         credentials: HTTP Bearer credentials containing the JWT token
         session: Database session (injected)
         
     Returns:
-        User object
+        Tuple of (AuthUser snapshot, raw access token)
         
     Raises:
         HTTPException: If token is invalid or revoked
     """
     token = credentials.credentials
+    cache_key = token_cache_key(token)
+    
+    cached_user = _user_cache.get(cache_key)
+    if cached_user is not None:
+        return cached_user, token
+    
+    # Read before the revocation check so any eviction from here on is seen
+    generation = _eviction_generation
     
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -65,14 +244,34 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    # Fetch user
-    q = await session.execute(
-        select(User).where(User.id == user_id)
-    )
-    user = q.scalars().first()
+    try:
+        user_uuid = UUID(str(user_id))
+    except ValueError:
+        raise credentials_exception
+
+    # Primary-key lookup checks the session identity map before querying
+    user = await session.get(User, user_uuid)
     if not user:
         raise credentials_exception
-    return user
+    
+    authed_user = AuthUser.from_user(user)
+    exp = payload.get("exp")
+    if exp and generation == _eviction_generation:
+        _user_cache.set(cache_key, authed_user, ttl=exp - time.time())
+    return authed_user, token
+
+
+async def get_current_user(authed: Tuple[AuthUser, str] = Depends(get_authed)) -> AuthUser:
+    """
+    Get current user from JWT token with revocation check.
+    
+    Args:
+        authed: Result of get_authed (injected)
+        
+    Returns:
+        AuthUser snapshot
+    """
+    return authed[0]
 
 
 def role_required(required_role: str):
@@ -85,7 +284,7 @@ def role_required(required_role: str):
     Returns:
         Dependency function
     """
-    async def role_checker(user: User = Depends(get_current_user)) -> User:
+    async def role_checker(user: AuthUser = Depends(get_current_user)) -> AuthUser:
         if getattr(user, "role", None) != required_role and getattr(user, "role", None) != "admin":
             raise HTTPException(status_code=403, detail="Forbidden")
         return user
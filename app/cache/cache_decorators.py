@@ -1,21 +1,31 @@
 """
 Cache decorators for easy function result caching.
 """
-import hashlib
-import json
+import inspect
+from datetime import date
+from enum import Enum
 from functools import wraps
-from typing import Callable, Any
+from typing import Callable, Any, Optional
+from uuid import UUID
+import xxhash
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from app.cache.redis_client import cache
 from app.core.logging import logger
 
+_SESSION_TYPES = (AsyncSession, Session)
 
-def cached(key_prefix: str, expire: int = 300):
+
+def cached(key_prefix: str, expire: int = 300, key_param: Optional[str] = None):
     """
     Decorator to cache function results with configurable TTL.
     
     Args:
         key_prefix: Prefix for the cache key
         expire: Expiration time in seconds (default: 300 = 5 minutes)
+        key_param: Optional argument whose value alone forms the key suffix,
+            giving a predictable key (e.g. ``events:detail:<id>``) that
+            callers can delete directly; by default all arguments are hashed
         
     Usage:
         @cached('events', expire=300)
@@ -23,10 +33,15 @@ def cached(key_prefix: str, expire: int = 300):
             return events
     """
     def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
             # Generate cache key from function args
-            args_key = _generate_key_from_args(args, kwargs)
+            if key_param is None:
+                args_key = _generate_key_from_args(signature, args, kwargs)
+            else:
+                args_key = _canonical(signature.bind(*args, **kwargs).arguments[key_param]).decode()
             cache_key = f"{key_prefix}:{args_key}"
             
             # Try to get from cache
@@ -47,31 +62,52 @@ def cached(key_prefix: str, expire: int = 300):
     return decorator
 
 
-def _generate_key_from_args(args: tuple, kwargs: dict) -> str:
+def _canonical(value: Any) -> bytes:
+    """
+    Render an argument so equivalent values produce identical key material.
+    
+    A UUID and its string form, an enum and its value, and equal datetimes
+    all canonicalize the same way.
+    """
+    if value is None:
+        return b'\x02'
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, (str, UUID)):
+        return str(value).encode()
+    if isinstance(value, date):
+        return value.isoformat().encode()
+    return repr(value).encode()
+
+
+def _generate_key_from_args(signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
     """
     Generate a unique cache key from function arguments.
     
+    Arguments are bound to the function signature with defaults applied, so
+    positional, keyword and omitted-default calls for the same filters share
+    one key.
+    
     Args:
+        signature: Signature of the cached function
         args: Positional arguments
         kwargs: Keyword arguments
         
     Returns:
-        MD5 hash of the arguments
+        xxh3-128 hash of the arguments
     """
-    # Skip first arg if it's 'self' or a session object
-    filtered_args = []
-    for arg in args:
-        arg_type = str(type(arg))
-        # Skip SQLAlchemy session objects
-        if 'AsyncSession' not in arg_type and 'Session' not in arg_type:
-            filtered_args.append(arg)
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
     
-    # Create a string representation of args
-    key_data = {
-        'args': [str(arg) for arg in filtered_args],
-        'kwargs': {k: str(v) for k, v in kwargs.items()}
-    }
-    key_string = json.dumps(key_data, sort_keys=True)
+    # Stream arguments straight into the hasher instead of building a JSON document
+    h = xxhash.xxh3_128()
+    for name, value in bound.arguments.items():
+        # Skip SQLAlchemy session objects
+        if isinstance(value, _SESSION_TYPES):
+            continue
+        h.update(name.encode())
+        h.update(b'=')
+        h.update(_canonical(value))
+        h.update(b'\x00')
     
-    # Return MD5 hash
-    return hashlib.md5(key_string.encode()).hexdigest()
+    return h.hexdigest()
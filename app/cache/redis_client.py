@@ -1,33 +1,68 @@
 """
-Redis cache client with connection pooling and JSON serialization.
+Redis cache client with connection pooling, orjson serialization and
+zstd compression for large values.
 """
-import json
-from typing import Optional, Any
-import redis
-from redis.connection import ConnectionPool
+from typing import Optional, Any, Iterable
+import orjson
+import zstandard as zstd
+from redis import asyncio as aioredis
 from app.core.config import settings
 from app.core.logging import logger
 
+# Number of keys fetched per SCAN step and removed per UNLINK command
+SCAN_BATCH_SIZE = 500
+
+# One-byte payload markers: raw JSON or zstd-compressed JSON
+_RAW = b'R'
+_ZSTD = b'Z'
+
+_compressor = zstd.ZstdCompressor(level=3)
+_decompressor = zstd.ZstdDecompressor()
+
+
+def _encode(value: Any) -> bytes:
+    """Serialize a value to JSON, compressing it when above the size threshold."""
+    raw = orjson.dumps(value, default=str, option=orjson.OPT_NAIVE_UTC)
+    threshold = settings.CACHE_COMPRESSION_THRESHOLD
+    if threshold > 0 and len(raw) > threshold:
+        return _ZSTD + _compressor.compress(raw)
+    return _RAW + raw
+
+
+def _decode(payload: bytes) -> Any:
+    """Inverse of _encode."""
+    marker, body = payload[:1], payload[1:]
+    if marker == _ZSTD:
+        return orjson.loads(_decompressor.decompress(body))
+    if marker == _RAW:
+        return orjson.loads(body)
+    # Entry written before payload markers were introduced
+    return orjson.loads(payload)
+
 
 class RedisCache:
-    """Redis cache client with connection pooling."""
+    """Async Redis cache client with connection pooling."""
     
     def __init__(self):
-        self._pool: Optional[ConnectionPool] = None
-        self._client: Optional[redis.Redis] = None
+        self._pool: Optional[aioredis.ConnectionPool] = None
+        self._client: Optional[aioredis.Redis] = None
     
-    def _get_client(self) -> redis.Redis:
+    def _get_client(self) -> aioredis.Redis:
         """Get or create Redis client with connection pooling."""
         if self._client is None:
-            self._pool = redis.ConnectionPool.from_url(
+            self._pool = aioredis.ConnectionPool.from_url(
                 settings.REDIS_URL,
-                decode_responses=True,
                 max_connections=20
             )
-            self._client = redis.Redis(connection_pool=self._pool)
+            self._client = aioredis.Redis(connection_pool=self._pool)
             logger.info("Redis connection pool created")
         return self._client
     
+    @staticmethod
+    def _key(key: str) -> str:
+        """Apply the configured namespace prefix to a key or pattern."""
+        return settings.CACHE_KEY_PREFIX + key
+    
     async def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache by key.
@@ -40,9 +75,9 @@ class RedisCache:
         """
         try:
             client = self._get_client()
-            value = client.get(key)
+            value = await client.get(self._key(key))
             if value:
-                return json.loads(value)
+                return _decode(value)
             return None
         except Exception as e:
             logger.error(f"Redis GET error for key {key}: {e}")
@@ -54,7 +89,7 @@ class RedisCache:
         
         Args:
             key: Cache key
-            value: Value to cache (will be JSON serialized)
+            value: Value to cache (JSON serialized, zstd-compressed if large)
             expire: Expiration time in seconds (default: 300)
             
         Returns:
@@ -62,8 +97,7 @@ class RedisCache:
         """
         try:
             client = self._get_client()
-            serialized = json.dumps(value, default=str)
-            client.setex(key, expire, serialized)
+            await client.setex(self._key(key), expire, _encode(value))
             return True
         except Exception as e:
             logger.error(f"Redis SET error for key {key}: {e}")
@@ -81,7 +115,7 @@ class RedisCache:
         """
         try:
             client = self._get_client()
-            client.delete(key)
+            await client.delete(self._key(key))
             return True
         except Exception as e:
             logger.error(f"Redis DELETE error for key {key}: {e}")
@@ -94,17 +128,41 @@ class RedisCache:
         Args:
             pattern: Key pattern (e.g., 'events:*')
             
+        Returns:
+            Number of keys deleted
+        """
+        return await self.invalidate(patterns=(pattern,))
+    
+    async def invalidate(self, keys: Iterable[str] = (), patterns: Iterable[str] = ()) -> int:
+        """
+        Delete explicit keys and all keys matching patterns in a single pipeline.
+        
+        Args:
+            keys: Exact cache keys to delete
+            patterns: Key patterns (e.g., 'events:list:*')
+            
         Returns:
             Number of keys deleted
         """
         try:
             client = self._get_client()
-            keys = client.keys(pattern)
-            if keys:
-                return client.delete(*keys)
-            return 0
+            # SCAN walks the keyspace incrementally instead of blocking Redis like KEYS,
+            # and UNLINK frees memory in the background instead of blocking like DEL.
+            # Every UNLINK is queued and sent in one round-trip on execute().
+            async with client.pipeline(transaction=False) as pipe:
+                batch = [self._key(key) for key in keys]
+                for pattern in patterns:
+                    async for key in client.scan_iter(match=self._key(pattern), count=SCAN_BATCH_SIZE):
+                        batch.append(key)
+                        if len(batch) >= SCAN_BATCH_SIZE:
+                            pipe.unlink(*batch)
+                            batch = []
+                if batch:
+                    pipe.unlink(*batch)
+                results = await pipe.execute()
+            return sum(results)
         except Exception as e:
-            logger.error(f"Redis DELETE_PATTERN error for pattern {pattern}: {e}")
+            logger.error(f"Redis INVALIDATE error for keys {keys} patterns {patterns}: {e}")
             return 0
     
     async def exists(self, key: str) -> bool:
@@ -119,15 +177,41 @@ class RedisCache:
         """
         try:
             client = self._get_client()
-            return client.exists(key) > 0
+            return await client.exists(self._key(key)) > 0
         except Exception as e:
             logger.error(f"Redis EXISTS error for key {key}: {e}")
             return False
     
-    def close(self):
+    async def publish(self, channel: str, message: str) -> bool:
+        """
+        Publish a message on a pub/sub channel.
+        
+        Args:
+            channel: Channel name
+            message: Message payload
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            client = self._get_client()
+            await client.publish(channel, message)
+            return True
+        except Exception as e:
+            logger.error(f"Redis PUBLISH error for channel {channel}: {e}")
+            return False
+    
+    def pubsub(self) -> aioredis.client.PubSub:
+        """Create a pub/sub handle on the shared connection pool."""
+        return self._get_client().pubsub()
+    
+    async def close(self):
         """Close Redis connection pool."""
         if self._client:
-            self._client.close()
+            await self._client.aclose()
+            await self._pool.aclose()
+            self._client = None
+            self._pool = None
             logger.info("Redis connection pool closed")
 
 
@@ -0,0 +1,15 @@
+"""
+Shared rate limiter backed by Redis so limits hold across workers and pods.
+"""
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+from app.core.config import settings
+
+# Counters live in Redis; if it is unreachable each worker falls back to
+# in-memory counting rather than failing the request
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URL or settings.REDIS_URL,
+    strategy="moving-window",
+    in_memory_fallback_enabled=True,
+)
@@ -1,14 +1,40 @@
 """
 Enhanced security module with JWT access and refresh tokens.
 """
-from datetime import datetime, timedelta
-from typing import Optional, Dict
-from jose import jwt, JWTError
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Optional, Dict, Tuple
+import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 from app.cache.redis_client import cache
+from app.cache.local_cache import LocalTTLCache
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id (OWASP minimum parameters); existing bcrypt hashes
+# still verify and are rehashed on the next successful login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19 * 1024,
+    argon2__parallelism=1,
+)
+
+# Password hashing is CPU-bound and releases the GIL; run it here so the event
+# loop keeps serving requests, with at most one hash per core in flight
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
+# Verified token payloads, so a token presented again skips HMAC and JSON parsing.
+# Entries also expire with the token itself, so the long cap mainly serves
+# refresh tokens, which clients present repeatedly over days.
+_decoded_tokens = LocalTTLCache(maxsize=10_000, ttl=3600)
+
+# Characters that satisfy the special-character password rule
+_SPECIAL_CHARACTERS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
 
 
 def validate_password(password: str) -> None:
@@ -25,16 +51,30 @@ def validate_password(password: str) -> None:
     if len(password) < 8:
         raise ValueError("Password must be at least 8 characters long")
     
-    if not any(c.isupper() for c in password):
+    # Single pass over the password, stopping once every class has been seen
+    has_upper = has_lower = has_digit = has_special = False
+    for c in password:
+        if c.isupper():
+            has_upper = True
+        elif c.islower():
+            has_lower = True
+        elif c.isdigit():
+            has_digit = True
+        elif c in _SPECIAL_CHARACTERS:
+            has_special = True
+        if has_upper and has_lower and has_digit and has_special:
+            return
+    
+    if not has_upper:
         raise ValueError("Password must contain at least one uppercase letter")
     
-    if not any(c.islower() for c in password):
+    if not has_lower:
         raise ValueError("Password must contain at least one lowercase letter")
     
-    if not any(c.isdigit() for c in password):
+    if not has_digit:
         raise ValueError("Password must contain at least one digit")
     
-    if not any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+    if not has_special:
         raise ValueError("Password must contain at least one special character")
 
 
@@ -43,11 +83,37 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+def verify_and_update_password(plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if the stored hash uses a deprecated scheme.
+    
+    Args:
+        plain: The plaintext password
+        hashed: The stored password hash
+        
+    Returns:
+        Tuple of (verified, replacement hash or None)
+    """
+    return pwd_context.verify_and_update(plain, hashed)
+
+
 def hash_password(password: str) -> str:
     """Hash a password."""
     return pwd_context.hash(password)
 
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the hashing thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, hash_password, password)
+
+
+async def verify_and_update_password_async(plain: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """Run verify_and_update_password on the hashing thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, verify_and_update_password, plain, hashed)
+
+
 def create_access_token(data: Dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -61,10 +127,11 @@ def create_access_token(data: Dict, expires_delta: Optional[timedelta] = None) -
     """
     to_encode = data.copy()
     
+    # Numeric exp (RFC 7519 NumericDate) straight from time.time()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = int(time.time()) + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
     to_encode.update({"exp": expire, "type": "access"})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
@@ -82,7 +149,7 @@ def create_refresh_token(data: Dict) -> str:
         Encoded JWT refresh token
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = int(time.time()) + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
     to_encode.update({"exp": expire, "type": "refresh"})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
@@ -101,6 +168,11 @@ def decode_token(token: str) -> Dict:
     Raises:
         ValueError: If token is invalid or expired
     """
+    cached_payload = _decoded_tokens.get(token)
+    if cached_payload is not None:
+        # Copy so callers cannot mutate the cached entry
+        return dict(cached_payload)
+    
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         
@@ -108,10 +180,13 @@ def decode_token(token: str) -> Dict:
         if "sub" not in payload:
             raise ValueError("Invalid token payload: missing 'sub' field")
         
+        # Never serve a cached payload past the token's own expiry
+        exp = payload.get("exp")
+        _decoded_tokens.set(token, dict(payload), ttl=exp - time.time() if exp else None)
         return payload
     except jwt.ExpiredSignatureError:
         raise ValueError("Token has expired")
-    except JWTError as e:
+    except jwt.InvalidTokenError as e:
         raise ValueError(f"Invalid token: {str(e)}")
 
 
@@ -135,7 +210,7 @@ async def revoke_token(token: str, expiry: Optional[int] = None) -> bool:
             payload = decode_token(token)
             exp = payload.get("exp")
             if exp:
-                ttl = exp - int(datetime.utcnow().timestamp())
+                ttl = exp - int(time.time())
                 if ttl > 0:
                     await cache.set(f"revoked_token:{token}", True, expire=ttl)
         
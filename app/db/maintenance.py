@@ -0,0 +1,42 @@
+"""
+Database maintenance tasks.
+
+Run periodically (e.g. from cron) with:
+    python -m app.db.maintenance
+"""
+import asyncio
+from typing import Sequence
+from sqlalchemy import text
+from app.db.session import engine
+from app.core.logging import logger
+
+# Tables whose visibility map and planner statistics should stay fresh.
+# rsvps relies on index-only scans over idx_rsvp_event_status for counts;
+# events needs accurate statistics for the planner to pick idx_event_search_tsv.
+MAINTENANCE_TABLES = ("rsvps", "events")
+
+
+async def vacuum_analyze(tables: Sequence[str] = MAINTENANCE_TABLES) -> None:
+    """
+    Run VACUUM ANALYZE on the given tables.
+    
+    VACUUM cannot run inside a transaction block, so an autocommit
+    connection is used.
+    
+    Args:
+        tables: Table names to vacuum and analyze
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for table in tables:
+            logger.info(f"Running VACUUM ANALYZE on {table}")
+            await conn.execute(text(f"VACUUM ANALYZE {table}"))
+
+
+async def main():
+    await vacuum_analyze()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, func, Enum, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, func, Enum, Index, Computed, text
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 import uuid
-from sqlalchemy.orm import relationship
 from app.db.session import Base
 import enum
 
@@ -18,6 +18,9 @@ class EventCategory(str, enum.Enum):
     food = "food"
     other = "other"
 
+# Full-text search document for events, stored in the generated search_tsv column
+EVENT_SEARCH_VECTOR = "to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(description, ''))"
+
 class Event(Base):
     __tablename__ = "events"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -29,13 +32,23 @@ class Event(Base):
     category = Column(Enum(EventCategory), nullable=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Going RSVPs, maintained by the rsvps_going_count trigger (see rsvp.py)
+    rsvp_going_count = Column(Integer, nullable=False, default=0, server_default='0')
+    # Precomputed search document; deferred so regular event loads skip it
+    search_tsv = deferred(Column(TSVECTOR, Computed(EVENT_SEARCH_VECTOR, persisted=True)))
 
     creator = relationship("User")
     
     # Indexes for frequently queried fields
+    # Composite indexes follow the list query: filter column first, then the
+    # (created_at DESC, id DESC) sort order so rows come back pre-sorted.
     __table_args__ = (
         Index('idx_event_date', 'starts_at'),
-        Index('idx_event_organizer', 'created_by'),
         Index('idx_event_created_at', 'created_at'),
         Index('idx_event_category', 'category'),
+        Index('idx_event_org_created', 'created_by', text('created_at DESC')),
+        Index('idx_event_cat_created', 'category', text('created_at DESC'),
+              postgresql_where=text('category IS NOT NULL')),
+        Index('idx_event_created_id', text('created_at DESC'), text('id DESC')),
+        Index('idx_event_search_tsv', 'search_tsv', postgresql_using='gin'),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, func, Enum, Index, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, func, Enum, Index, UniqueConstraint, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from sqlalchemy.orm import relationship
@@ -26,5 +26,36 @@ class RSVP(Base):
     __table_args__ = (
         UniqueConstraint('user_id', 'event_id', name='uq_user_event_rsvp'),
         Index('idx_rsvp_user', 'user_id'),
-        Index('idx_rsvp_event', 'event_id'),
+        # Covering index so going-RSVP counts per event are index-only scans;
+        # its leading event_id column also serves plain per-event lookups
+        Index('idx_rsvp_event_status', 'event_id', 'status', postgresql_include=['user_id']),
     )
+
+# Keep events.rsvp_going_count in step with going RSVPs. Alembic installs the
+# same trigger; these listeners cover tables created through create_all.
+RSVP_GOING_COUNT_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION bump_rsvp_going_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        IF OLD.status = 'going' THEN
+            UPDATE events SET rsvp_going_count = rsvp_going_count - 1 WHERE id = OLD.event_id;
+        END IF;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        IF NEW.status = 'going' THEN
+            UPDATE events SET rsvp_going_count = rsvp_going_count + 1 WHERE id = NEW.event_id;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+RSVP_GOING_COUNT_TRIGGER = DDL("""
+CREATE TRIGGER rsvps_going_count
+AFTER INSERT OR DELETE OR UPDATE OF status, event_id ON rsvps
+FOR EACH ROW EXECUTE FUNCTION bump_rsvp_going_count()
+""")
+
+event.listen(RSVP.__table__, "after_create", RSVP_GOING_COUNT_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(RSVP.__table__, "after_create", RSVP_GOING_COUNT_TRIGGER.execute_if(dialect="postgresql"))
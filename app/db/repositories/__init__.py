@@ -4,7 +4,8 @@ Repository layer for database operations.
 Provides async functions for CRUD operations on User, Event, and RSVP entities.
 Includes caching support via Redis for frequently accessed data.
 """
-from sqlalchemy import select, or_, func
+from sqlalchemy import select, or_, func, cast, literal, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.user import User
 from app.db.models.event import Event
@@ -13,7 +14,7 @@ from app.schemas import UserCreate, EventCreate, RSVPCreate
 from typing import Optional, List
 from app.cache.cache_decorators import cached
 from app.cache.redis_client import cache
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 from datetime import datetime
 import uuid
 
@@ -27,13 +28,22 @@ async def create_user(db: AsyncSession, user_in: UserCreate):
         user_in: User registration data
         
     Returns:
-        Created User object
+        Created User object, or None if the email is already registered
     """
-    hashed = hash_password(user_in.password)
-    user = User(email=user_in.email, hashed_password=hashed, full_name=user_in.full_name)
-    db.add(user)
+    hashed = await hash_password_async(user_in.password)
+    # The unique email index decides duplicates, so concurrent signups cannot both pass a pre-check
+    stmt = (
+        pg_insert(User)
+        .values(email=user_in.email, hashed_password=hashed, full_name=user_in.full_name)
+        .on_conflict_do_nothing(index_elements=['email'])
+        .returning(User)
+    )
+    res = await db.execute(stmt)
+    user = res.scalars().first()
+    if user is None:
+        await db.rollback()
+        return None
     await db.commit()
-    await db.refresh(user)
     return user
 
 async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
@@ -62,9 +72,8 @@ async def get_user(db: AsyncSession, user_id):
     Returns:
         User object if found, None otherwise
     """
-    q = select(User).where(User.id == user_id)
-    res = await db.execute(q)
-    return res.scalars().first()
+    # Primary-key lookup checks the session identity map before querying
+    return await db.get(User, user_id)
 
 async def create_event(db: AsyncSession, payload: EventCreate, creator_id):
     """
@@ -88,24 +97,16 @@ async def create_event(db: AsyncSession, payload: EventCreate, creator_id):
     
     return ev
 
-@cached('events:list', expire=300)  # Cache for 5 minutes
-async def list_events(
-    db: AsyncSession, 
-    limit: int = 20, 
-    offset: int = 0,
+def _apply_event_filters(
+    q,
     created_by: Optional[str] = None,
     starts_after: Optional[datetime] = None,
     starts_before: Optional[datetime] = None,
     search: Optional[str] = None,
-    category: Optional[str] = None
-) -> List[dict]:
-    """
-    List events with pagination, filtering, and search support.
-    Returns a list of event dictionaries for caching compatibility.
-    """
-    q = select(Event).order_by(Event.created_at.desc())
-    
-    # Apply filters
+    category: Optional[str] = None,
+    title_contains: Optional[str] = None
+):
+    """Apply the shared event list filters and full-text search to a query."""
     if created_by:
         q = q.where(Event.created_by == created_by)
     if starts_after:
@@ -114,109 +115,179 @@ async def list_events(
         q = q.where(Event.starts_at <= starts_before)
     if category:
         q = q.where(Event.category == category)
+    if title_contains:
+        # lower(title) LIKE '%...%' is served by the idx_event_title_trgm trigram index
+        pattern = title_contains.lower().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        q = q.where(func.lower(Event.title).like(f"%{pattern}%", escape='\\'))
     
     # Apply full-text search
     if search:
-        # Use PostgreSQL full-text search with to_tsvector
-        search_vector = func.to_tsvector('english', 
-            func.coalesce(Event.title, '') + ' ' + func.coalesce(Event.description, ''))
-        search_query = func.plainto_tsquery('english', search)
-        q = q.where(search_vector.op('@@')(search_query))
+        # search_tsv is a stored column indexed by idx_event_search_tsv, so
+        # matching rows need no to_tsvector recomputation on recheck
+        # websearch_to_tsquery parses quotes, "or" and "-term" itself and never
+        # raises on malformed input, so the raw string is passed as a bind param
+        search_query = func.websearch_to_tsquery(literal_column("'english'"), search)
+        q = q.where(Event.search_tsv.op('@@')(search_query))
+    
+    return q
+
+# Columns read for event listings and details; selecting them directly skips
+# ORM object construction and identity-map bookkeeping for read-only rows
+_EVENT_COLUMNS = (
+    Event.id,
+    Event.title,
+    Event.description,
+    Event.location,
+    Event.starts_at,
+    Event.capacity,
+    Event.category,
+    Event.created_by,
+    Event.created_at,
+    Event.rsvp_going_count,
+)
+_EVENT_COLUMN_COUNT = len(_EVENT_COLUMNS)
+
+def _json_datetime(value: Optional[datetime]) -> Optional[str]:
+    """Format a datetime exactly as Pydantic's JSON mode does (UTC as "Z")."""
+    return value.isoformat().replace("+00:00", "Z") if value else None
+
+def _serialize_event(row) -> dict:
+    """Convert an event row (see _EVENT_COLUMNS) to a cacheable dict with available spots."""
+    # Positional unpacking is much cheaper than per-field Row attribute lookups
+    (ev_id, title, description, location, starts_at, capacity,
+     category, created_by, created_at, going_count) = row[:_EVENT_COLUMN_COUNT]
+    
+    available_spots = None
+    if capacity and capacity > 0:
+        available_spots = max(0, capacity - going_count)
+    
+    return {
+        'id': str(ev_id),
+        'title': title,
+        'description': description,
+        'location': location,
+        'starts_at': _json_datetime(starts_at),
+        'capacity': capacity,
+        'category': category.value if category else None,
+        'created_by': str(created_by),
+        'created_at': _json_datetime(created_at),
+        'available_spots': available_spots
+    }
+
+@cached('events:list', expire=300)  # Cache for 5 minutes
+async def list_events(
+    db: AsyncSession, 
+    limit: int = 20, 
+    offset: int = 0,
+    created_by: Optional[str] = None,
+    starts_after: Optional[datetime] = None,
+    starts_before: Optional[datetime] = None,
+    search: Optional[str] = None,
+    category: Optional[str] = None,
+    title_contains: Optional[str] = None
+) -> List[dict]:
+    """
+    List events with pagination, filtering, and search support.
+    Returns a list of event dictionaries for caching compatibility.
+    """
+    q = select(*_EVENT_COLUMNS).order_by(Event.created_at.desc(), Event.id.desc())
+    q = _apply_event_filters(q, created_by, starts_after, starts_before, search, category, title_contains)
     
     # Apply pagination
     q = q.limit(limit).offset(offset)
     
     res = await db.execute(q)
-    events = res.scalars().all()
+    return [_serialize_event(row) for row in res.all()]
+
+@cached('events:list:page', expire=300)  # Cache for 5 minutes
+async def list_events_with_total(
+    db: AsyncSession,
+    limit: int = 20,
+    offset: int = 0,
+    created_by: Optional[str] = None,
+    starts_after: Optional[datetime] = None,
+    starts_before: Optional[datetime] = None,
+    search: Optional[str] = None,
+    category: Optional[str] = None,
+    title_contains: Optional[str] = None
+) -> dict:
+    """
+    List a page of events together with the total number of matches.
     
-    # Convert to list of dicts for caching, calculate available spots
-    result = []
-    for ev in events:
-        rsvp_count = await get_event_rsvp_count(db, str(ev.id))
-        available_spots = None
-        if ev.capacity and ev.capacity > 0:
-            available_spots = max(0, ev.capacity - rsvp_count)
-        
-        result.append({
-            'id': str(ev.id),
-            'title': ev.title,
-            'description': ev.description,
-            'location': ev.location,
-            'starts_at': ev.starts_at.isoformat() if ev.starts_at else None,
-            'capacity': ev.capacity,
-            'category': ev.category.value if ev.category else None,
-            'created_by': str(ev.created_by),
-            'created_at': ev.created_at.isoformat() if ev.created_at else None,
-            'available_spots': available_spots
-        })
+    The total comes from a ``COUNT(*) OVER ()`` window on the page query, so
+    the filters (including full-text search) are evaluated once instead of
+    once for the page and again for a separate count.
     
-    return result
+    Returns:
+        Dict with 'total' and 'items' keys
+    """
+    q = select(*_EVENT_COLUMNS, func.count().over().label('total_count')).order_by(
+        Event.created_at.desc(), Event.id.desc()
+    )
+    q = _apply_event_filters(q, created_by, starts_after, starts_before, search, category, title_contains)
+    q = q.limit(limit).offset(offset)
+    
+    res = await db.execute(q)
+    rows = res.all()
+    
+    if rows:
+        total = rows[0].total_count
+    elif offset > 0:
+        # A page past the end has no rows to carry the window count
+        total = await _count_events(db, created_by, starts_after, starts_before, search, category, title_contains)
+    else:
+        total = 0
+    
+    return {
+        'total': total,
+        'items': [_serialize_event(row) for row in rows]
+    }
+
+async def _count_events(
+    db: AsyncSession,
+    created_by: Optional[str] = None,
+    starts_after: Optional[datetime] = None,
+    starts_before: Optional[datetime] = None,
+    search: Optional[str] = None,
+    category: Optional[str] = None,
+    title_contains: Optional[str] = None
+) -> int:
+    q = select(func.count(Event.id))
+    q = _apply_event_filters(q, created_by, starts_after, starts_before, search, category, title_contains)
+    res = await db.execute(q)
+    return res.scalar() or 0
 
-@cached('events:count', expire=300)  # Cache for 5 minutes
+@cached('events:list:count', expire=300)  # Shares the list namespace so list invalidation covers counts
 async def count_events(
     db: AsyncSession,
     created_by: Optional[str] = None,
     starts_after: Optional[datetime] = None,
     starts_before: Optional[datetime] = None,
     search: Optional[str] = None,
-    category: Optional[str] = None
+    category: Optional[str] = None,
+    title_contains: Optional[str] = None
 ) -> int:
     """
     Count total events matching the given filters.
     Used for pagination metadata.
     """
-    q = select(func.count(Event.id))
-    
-    # Apply same filters as list_events
-    if created_by:
-        q = q.where(Event.created_by == created_by)
-    if starts_after:
-        q = q.where(Event.starts_at >= starts_after)
-    if starts_before:
-        q = q.where(Event.starts_at <= starts_before)
-    if category:
-        q = q.where(Event.category == category)
-    
-    # Apply full-text search
-    if search:
-        search_vector = func.to_tsvector('english', 
-            func.coalesce(Event.title, '') + ' ' + func.coalesce(Event.description, ''))
-        search_query = func.plainto_tsquery('english', search)
-        q = q.where(search_vector.op('@@')(search_query))
-    
-    res = await db.execute(q)
-    return res.scalar() or 0
+    return await _count_events(db, created_by, starts_after, starts_before, search, category, title_contains)
 
-@cached('events:detail', expire=300)  # Cache for 5 minutes
+# Keyed by the bare event id so writes can drop events:detail:<id> directly
+@cached('events:detail', expire=300, key_param='event_id')  # Cache for 5 minutes
 async def get_event(db: AsyncSession, event_id):
-    q = select(Event).where(Event.id == event_id)
+    q = select(*_EVENT_COLUMNS).where(Event.id == event_id)
     res = await db.execute(q)
-    ev = res.scalars().first()
-    if ev:
-        # Calculate available spots
-        rsvp_count = await get_event_rsvp_count(db, str(ev.id))
-        available_spots = None
-        if ev.capacity and ev.capacity > 0:
-            available_spots = max(0, ev.capacity - rsvp_count)
-        
+    row = res.first()
+    if row:
         # Convert to dict for caching
-        return {
-            'id': str(ev.id),
-            'title': ev.title,
-            'description': ev.description,
-            'location': ev.location,
-            'starts_at': ev.starts_at.isoformat() if ev.starts_at else None,
-            'capacity': ev.capacity,
-            'category': ev.category.value if ev.category else None,
-            'created_by': str(ev.created_by),
-            'created_at': ev.created_at.isoformat() if ev.created_at else None,
-            'available_spots': available_spots
-        }
+        return _serialize_event(row)
     return None
 
 async def get_event_rsvp_count(db: AsyncSession, event_id: str) -> int:
     """Get the count of confirmed RSVPs (going) for an event."""
-    q = select(func.count(RSVP.id)).where(
+    # count(*) needs no column values, so idx_rsvp_event_status answers it index-only
+    q = select(func.count()).select_from(RSVP).where(
         RSVP.event_id == event_id,
         RSVP.status == RSVPStatusEnum.going
     )
@@ -231,44 +302,61 @@ async def create_rsvp(db: AsyncSession, user_id, payload: RSVPCreate):
     from fastapi import HTTPException
     from sqlalchemy.exc import IntegrityError
     
-    # Get the event to check capacity
-    event_q = select(Event).where(Event.id == payload.event_id)
-    event_res = await db.execute(event_q)
-    event = event_res.scalars().first()
+    going = payload.status == "going"
     
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
+    # Check and insert in one round trip: the INSERT selects from the event row,
+    # which yields nothing if the event is missing or (for going RSVPs) full.
+    # FOR UPDATE locks the event until commit; a concurrent RSVP waiting on the
+    # lock re-evaluates the spot check against the committed going count.
+    source = select(
+        literal(user_id, RSVP.user_id.type),
+        Event.id,
+        # The enum literal needs an explicit cast; a bare SELECT-list parameter resolves to text
+        cast(literal(payload.status, RSVP.status.type), RSVP.status.type)
+    ).where(Event.id == payload.event_id)
+    if going:
+        source = source.where(or_(
+            func.coalesce(Event.capacity, 0) <= 0,
+            Event.rsvp_going_count < Event.capacity
+        )).with_for_update()
     
-    # Check capacity if event has a capacity limit and RSVP status is "going"
-    if event.capacity and event.capacity > 0 and payload.status == "going":
-        current_count = await get_event_rsvp_count(db, payload.event_id)
-        if current_count >= event.capacity:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Event is at full capacity ({event.capacity} attendees)"
-            )
-    
-    # Create the RSVP
-    r = RSVP(user_id=user_id, event_id=payload.event_id, status=payload.status)
-    db.add(r)
+    # uq_user_event_rsvp turns a duplicate into an empty RETURNING as well
+    stmt = (
+        pg_insert(RSVP)
+        .from_select(['user_id', 'event_id', 'status'], source)
+        .on_conflict_do_nothing(constraint='uq_user_event_rsvp')
+        .returning(RSVP)
+    )
     
     try:
-        await db.commit()
-        await db.refresh(r)
-    except IntegrityError as e:
+        res = await db.execute(stmt)
+        r = res.scalars().first()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Database constraint violation")
+    
+    if r is None:
         await db.rollback()
-        # Check if it's a unique constraint violation for user+event
-        if "uq_user_event_rsvp" in str(e.orig) or "duplicate key" in str(e.orig).lower():
+        # Nothing was inserted; look at the event only to pick the right error
+        event = await db.get(Event, payload.event_id, populate_existing=True)
+        if not event:
+            raise HTTPException(status_code=404, detail="Event not found")
+        if going and event.capacity and event.capacity > 0 and event.rsvp_going_count >= event.capacity:
             raise HTTPException(
-                status_code=409,
-                detail="You have already RSVP'd to this event. Please update your existing RSVP instead."
+                status_code=400, 
+                detail=f"Event is at full capacity ({event.capacity} attendees)"
             )
-        # Re-raise if it's a different integrity error
-        raise HTTPException(status_code=400, detail="Database constraint violation")
+        raise HTTPException(
+            status_code=409,
+            detail="You have already RSVP'd to this event. Please update your existing RSVP instead."
+        )
+    await db.commit()
     
     # Invalidate event caches since RSVP count affects available_spots
-    await cache.delete_pattern("events:list:*")
-    await cache.delete(f"events:detail:{payload.event_id}")
+    await cache.invalidate(
+        keys=(f"events:detail:{payload.event_id}",),
+        patterns=("events:list:*",)
+    )
     
     return r
 
@@ -9,10 +9,24 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
     future=True,
-    pool_size=20,              # Number of permanent connections to maintain
-    max_overflow=10,           # Maximum number of connections to allow beyond pool_size
+    pool_size=max(2, settings.DB_POOL_SIZE),  # Permanent connections per worker process
+    max_overflow=settings.DB_MAX_OVERFLOW,     # Extra connections allowed beyond pool_size
+    pool_use_lifo=True,        # Reuse the most recent connection so idle extras can time out
     pool_pre_ping=True,        # Verify connections before using them
-    pool_recycle=3600,         # Recycle connections after 1 hour (3600 seconds)
+    pool_recycle=1800,         # Recycle connections after 30 minutes (1800 seconds)
+    # Compiled SQL cache; each filter combination of the event queries is its
+    # own entry, so leave room above the default of 500
+    query_cache_size=1200,
+    connect_args={
+        "server_settings": {
+            "jit": "off",                      # JIT compile cost dwarfs our short CRUD queries
+            "application_name": "community_hub",
+        },
+        # Reuse prepared statements across executions on a connection.
+        # Set DB_STATEMENT_CACHE_SIZE=0 behind pgbouncer in transaction mode.
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    },
 )
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 Base = declarative_base()
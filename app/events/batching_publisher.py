@@ -0,0 +1,120 @@
+"""
+Batches outgoing domain events so request handlers never wait on the broker.
+"""
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Tuple
+from app.core.logging import logger
+
+# Largest number of events published together
+MAX_BATCH = 50
+# Longest time the first event of a batch waits for company (seconds)
+FLUSH_INTERVAL = 0.02
+# Events held while the broker is slow or down; newer events are dropped beyond this
+MAX_QUEUED = 10_000
+# Extra attempts for a batch the broker rejected, and the pause before each
+PUBLISH_RETRIES = 2
+RETRY_DELAY = 0.5
+
+QueuedEvent = Tuple[str, dict]
+
+# Queued by close() so the flusher drains what is ahead of it and exits
+_STOP = object()
+
+
+class BatchPublisher:
+    """
+    Queue events in memory and publish them from a single background task.
+
+    The flusher starts lazily on the first enqueue, takes up to MAX_BATCH
+    events or whatever arrived within FLUSH_INTERVAL, and hands the batch to
+    the send callable in one go. A failed batch is retried before it is
+    dropped, and while the broker is unavailable at most MAX_QUEUED events
+    are held; anything beyond that is dropped and logged.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[QueuedEvent]], Awaitable[None]],
+        max_batch: int = MAX_BATCH,
+        flush_interval: float = FLUSH_INTERVAL,
+        max_queued: int = MAX_QUEUED,
+        retries: int = PUBLISH_RETRIES,
+        retry_delay: float = RETRY_DELAY
+    ):
+        self._send = send
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self._queue: "asyncio.Queue[QueuedEvent]" = asyncio.Queue(maxsize=max_queued)
+        self._task: Optional[asyncio.Task] = None
+        # Events rejected since the queue last had room
+        self._dropped = 0
+
+    async def enqueue(self, routing_key: str, payload: dict) -> None:
+        """
+        Queue an event for publishing and return immediately.
+
+        Args:
+            routing_key: Routing key for the topic exchange
+            payload: JSON-serializable event body
+        """
+        try:
+            self._queue.put_nowait((routing_key, payload))
+        except asyncio.QueueFull:
+            if not self._dropped:
+                logger.error(f"Event queue full ({self._queue.maxsize}); dropping events until the broker catches up")
+            self._dropped += 1
+        else:
+            if self._dropped:
+                logger.warning(f"Event queue has room again; {self._dropped} event(s) were dropped")
+                self._dropped = 0
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Flush batches until the close() sentinel arrives."""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            stopping = False
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._publish(batch)
+            if stopping:
+                return
+
+    async def _publish(self, batch: List[QueuedEvent]) -> None:
+        for attempt in range(self.retries + 1):
+            try:
+                await self._send(batch)
+                return
+            except Exception as e:
+                if attempt == self.retries:
+                    logger.error(f"Dropping {len(batch)} event(s) after {attempt + 1} failed publish attempts: {e}")
+                    return
+                logger.warning(f"Failed to publish {len(batch)} event(s), retrying: {e}")
+                await asyncio.sleep(self.retry_delay)
+
+    async def close(self) -> None:
+        """Publish everything already queued, then stop the flusher."""
+        if self._task is None or self._task.done():
+            return
+        # Waits for room if the queue is full; the flusher is draining it
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
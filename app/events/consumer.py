@@ -4,9 +4,12 @@ from app.core.config import settings
 from app.core.logging import logger
 from app.websocket.manager import manager
 from app.db.session import AsyncSessionLocal
-from app.db.models import Event, RSVP, User
+from app.db.models import Event, User
 from sqlalchemy import select
 
+# Messages handled concurrently by one worker (also the AMQP prefetch window)
+CONSUMER_PREFETCH = 32
+
 async def handle_message(body: bytes):
     data = json.loads(body.decode())
     typ = data.get("type")
@@ -16,14 +19,19 @@ async def handle_message(body: bytes):
         user_id = data.get("user_id")
         # fetch some data for message
         async with AsyncSessionLocal() as session:
-            ev = (await session.execute(select(Event).where(Event.id == event_id))).scalars().first()
-            usr = (await session.execute(select(User).where(User.id == user_id))).scalars().first()
-            if ev:
-                payload = {"type": "rsvp.created", "event_id": str(event_id), "event_title": ev.title, "user_email": usr.email if usr else None}
-                # send to creator
-                await manager.send_personal_message(ev.created_by, payload)
-                # optionally send to rsvp user as confirmation
-                await manager.send_personal_message(user_id, {"type":"rsvp.confirmation","event":ev.title})
+            # One round-trip for just the columns the notification needs
+            q = (
+                select(Event.title, Event.created_by, User.email)
+                .outerjoin(User, User.id == user_id)
+                .where(Event.id == event_id)
+            )
+            ev = (await session.execute(q)).first()
+        if ev:
+            payload = {"type": "rsvp.created", "event_id": str(event_id), "event_title": ev.title, "user_email": ev.email}
+            # send to creator
+            await manager.send_personal_message(ev.created_by, payload)
+            # optionally send to rsvp user as confirmation
+            await manager.send_personal_message(user_id, {"type":"rsvp.confirmation","event":ev.title})
     # handle other event types here
 
 async def run_worker():
@@ -40,13 +48,25 @@ async def run_worker():
                 raise
             await asyncio.sleep(delay)
     channel = await connection.channel()
+    # The broker keeps at most this many unacked messages in flight per worker
+    await channel.set_qos(prefetch_count=CONSUMER_PREFETCH)
     exchange = await channel.declare_exchange("communityhub.events", ExchangeType.TOPIC, durable=True)
     queue = await channel.declare_queue("communityhub.notifications", durable=True)
     await queue.bind(exchange, routing_key="rsvp.*")
+    
+    # Strong references so in-flight tasks are not garbage collected
+    in_flight = set()
+    
+    async def process(message):
+        async with message.process():
+            try:
+                await handle_message(message.body)
+            except Exception as e:
+                logger.error(f"Error handling message: {e}", exc_info=True)
+    
     async with queue.iterator() as queue_iter:
         async for message in queue_iter:
-            async with message.process():
-                try:
-                    await handle_message(message.body)
-                except Exception as e:
-                    logger.error(f"Error handling message: {e}", exc_info=True)
+            # Overlap DB and WebSocket waits; prefetch bounds the concurrency
+            task = asyncio.create_task(process(message))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
@@ -1,22 +1,53 @@
 import json
 import asyncio
-from aio_pika import connect_robust, Message, ExchangeType
+from aio_pika import connect_robust, Message, ExchangeType, DeliveryMode
+from typing import List
 from app.core.config import settings
+from app.events.batching_publisher import BatchPublisher, QueuedEvent
 
 _connection = None
 _channel = None
+_exchange = None
+_lock = asyncio.Lock()
 
 async def get_rabbit_connection():
-    global _connection, _channel
+    global _connection, _channel, _exchange
     if _connection and not _connection.is_closed:
         return _connection, _channel
-    _connection = await connect_robust(settings.RABBITMQ_URL)
-    _channel = await _connection.channel()
+    async with _lock:
+        # Another publisher may have connected while we waited
+        if _connection and not _connection.is_closed:
+            return _connection, _channel
+        _connection = await connect_robust(settings.RABBITMQ_URL)
+        _channel = await _connection.channel()
+        _exchange = None
     return _connection, _channel
 
-async def publish_event(routing_key: str, payload: dict):
+async def get_exchange():
+    """
+    Return the events exchange, declaring it once per connection.
+    The robust channel re-declares it by itself after a reconnect.
+    """
+    global _exchange
     _, channel = await get_rabbit_connection()
-    exchange = await channel.declare_exchange("communityhub.events", ExchangeType.TOPIC, durable=True)
-    body = json.dumps(payload).encode()
-    message = Message(body, content_type="application/json")
-    await exchange.publish(message, routing_key=routing_key)
+    if _exchange is None:
+        _exchange = await channel.declare_exchange("communityhub.events", ExchangeType.TOPIC, durable=True)
+    return _exchange
+
+async def publish_batch(events: List[QueuedEvent]):
+    """Publish queued events together; their broker confirms are awaited concurrently."""
+    exchange = await get_exchange()
+    # Notifications are transient; skip broker persistence explicitly
+    await asyncio.gather(*(
+        exchange.publish(
+            Message(json.dumps(payload).encode(), content_type="application/json", delivery_mode=DeliveryMode.NOT_PERSISTENT),
+            routing_key=routing_key
+        )
+        for routing_key, payload in events
+    ))
+
+batch_publisher = BatchPublisher(publish_batch)
+
+async def publish_event(routing_key: str, payload: dict):
+    """Queue an event; the batch publisher sends it without blocking the caller."""
+    await batch_publisher.enqueue(routing_key, payload)
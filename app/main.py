@@ -1,24 +1,28 @@
 import asyncio
+from contextlib import suppress
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request, Query, status, APIRouter
+from fastapi.responses import ORJSONResponse
 from app.api.v1.routes import auth as auth_router, events as events_router, rsvps as rsvps_router, health as health_router
 from app.db.session import engine, Base
 from app.events.consumer import run_worker
+from app.auth import listen_for_revocations
+from app.events.publisher import batch_publisher
 from app.websocket.manager import manager
 from app.core.config import settings
 from app.core.security import decode_token
 from app.core.logging import logger
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
+from app.core.rate_limit import limiter
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 import os
 import sqlalchemy
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
-
-app = FastAPI(title="CommunityHub")
+# orjson encodes every JSON response; the event loop comes from uvicorn, which
+# picks uvloop automatically when it is installed
+app = FastAPI(title="CommunityHub", default_response_class=ORJSONResponse)
 
 # Add rate limiter to app state
 app.state.limiter = limiter
@@ -35,6 +39,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON responses; small payloads are not worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(auth_router.router)
 api_router.include_router(events_router.router)
@@ -51,6 +58,25 @@ async def on_startup():
     # start background consumer in a task (worker is separate but for demo we also start here)
     # Note: In docker-compose, worker service runs the worker. Starting here helps local simple runs.
     asyncio.create_task(run_worker())
+    # Evict revoked tokens from this worker's auth cache as they are announced.
+    # The auth cache TTL relies on this feed, so keep a handle and report if it dies.
+    app.state.revocation_listener = asyncio.create_task(listen_for_revocations())
+    app.state.revocation_listener.add_done_callback(_log_listener_exit)
+
+def _log_listener_exit(task: asyncio.Task):
+    if task.cancelled():
+        return
+    logger.error(f"Token revocation listener exited: {task.exception()!r}")
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    listener = getattr(app.state, "revocation_listener", None)
+    if listener is not None:
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
+    # Publish events still waiting in the batch queue
+    await batch_publisher.close()
 
 @app.websocket("/ws/notifications/{user_id}")
 async def websocket_endpoint(websocket: WebSocket, user_id: str, token: str = Query(...)):
@@ -2,7 +2,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas import UserCreate, LoginRequest
 from app.db.repositories import create_user as db_create_user, get_user_by_email as db_get_user_by_email
-from app.core.security import create_access_token, create_refresh_token, verify_password, revoke_token
+from app.core.security import (
+    create_access_token, create_refresh_token, decode_token, revoke_token,
+    validate_password, verify_and_update_password_async,
+)
+from app.auth import forget_token
 from fastapi import HTTPException, status
 
 
@@ -35,17 +39,14 @@ class AuthService:
         Raises:
             HTTPException: If password is weak or email already exists
         """
-        from app.core.security import validate_password
         try:
             validate_password(payload.password)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
         
-        existing = await db_get_user_by_email(self.session, payload.email)
-        if existing:
-            raise HTTPException(status_code=400, detail="Email already registered")
-        
         user = await db_create_user(self.session, payload)
+        if user is None:
+            raise HTTPException(status_code=400, detail="Email already registered")
         return user
 
     async def login(self, form_data: LoginRequest):
@@ -62,9 +63,18 @@ class AuthService:
             HTTPException: If credentials are invalid
         """
         user = await db_get_user_by_email(self.session, form_data.email)
-        if not user or not verify_password(form_data.password, user.hashed_password):
+        if not user:
             raise HTTPException(status_code=401, detail="Incorrect credentials")
         
+        verified, new_hash = await verify_and_update_password_async(form_data.password, user.hashed_password)
+        if not verified:
+            raise HTTPException(status_code=401, detail="Incorrect credentials")
+        
+        if new_hash:
+            # Upgrade legacy bcrypt hashes to argon2id while we have the plaintext
+            user.hashed_password = new_hash
+            await self.session.commit()
+        
         token_data = {"sub": str(user.id), "user_id": str(user.id), "role": user.role.value}
         access_token = create_access_token(token_data)
         refresh_token = create_refresh_token(token_data)
@@ -88,7 +98,6 @@ class AuthService:
         Raises:
             HTTPException: If refresh token is invalid or wrong token type
         """
-        from app.core.security import decode_token
         try:
             token_data = decode_token(refresh_token)
         except ValueError:
@@ -123,3 +132,4 @@ class AuthService:
             token: Access token to revoke
         """
         await revoke_token(token)
+        await forget_token(token)
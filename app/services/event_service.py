@@ -3,8 +3,7 @@ from app.schemas import EventCreate
 from app.db.repositories import (
     create_event as db_create_event, 
     get_event as db_get_event, 
-    list_events as db_list_events,
-    count_events as db_count_events
+    list_events_with_total as db_list_events_with_total
 )
 from app.events.publisher import publish_event
 from typing import List, Optional, Tuple
@@ -31,23 +30,14 @@ class EventService:
         starts_before: Optional[datetime],
         search: Optional[str],
         category: Optional[str],
+        title_contains: Optional[str] = None,
     ) -> Tuple[int, List[dict]]:
         """
         List events with pagination support.
         Returns tuple of (total_count, events).
         """
-        # Get total count with same filters
-        total = await db_count_events(
-            self.session,
-            created_by=created_by,
-            starts_after=starts_after,
-            starts_before=starts_before,
-            search=search,
-            category=category,
-        )
-        
-        # Get paginated events
-        events = await db_list_events(
+        # Single query returns both the page and the total match count
+        page = await db_list_events_with_total(
             self.session,
             limit=limit,
             offset=skip,
@@ -56,6 +46,7 @@ class EventService:
             starts_before=starts_before,
             search=search,
             category=category,
+            title_contains=title_contains,
         )
         
-        return total, events
+        return page['total'], page['items']
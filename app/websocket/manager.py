@@ -1,42 +1,79 @@
-from typing import Dict, List
+from typing import Dict, Iterable, List, Set, Tuple
 from fastapi import WebSocket
 import asyncio
-import json
+import orjson
 
 class ConnectionManager:
     def __init__(self):
         # map user_id -> set of websockets
-        self.active: Dict[str, List[WebSocket]] = {}
+        self.active: Dict[str, Set[WebSocket]] = {}
         self.lock = asyncio.Lock()
 
     async def connect(self, user_id: str, websocket: WebSocket):
         await websocket.accept()
         async with self.lock:
-            conns = self.active.get(user_id, [])
-            conns.append(websocket)
-            self.active[user_id] = conns
+            self.active.setdefault(user_id, set()).add(websocket)
 
     async def disconnect(self, user_id: str, websocket: WebSocket):
         async with self.lock:
-            conns = self.active.get(user_id, [])
-            if websocket in conns:
-                conns.remove(websocket)
-            if conns:
-                self.active[user_id] = conns
-            else:
-                self.active.pop(user_id, None)
+            conns = self.active.get(user_id)
+            if conns is not None:
+                conns.discard(websocket)
+                if not conns:
+                    self.active.pop(user_id, None)
 
     async def send_personal_message(self, user_id, message: dict):
-        conns = self.active.get(str(user_id), [])
-        data = json.dumps(message)
-        for ws in list(conns):
+        user_id = str(user_id)
+        # Snapshot without awaiting so connects/disconnects during the sends are safe
+        targets = [(user_id, ws) for ws in self.active.get(user_id, ())]
+        if targets:
+            await self._send_all(targets, self._encode(message))
+
+    async def broadcast(self, user_ids: Iterable, message: dict):
+        """
+        Send the same message to every connection of the given users.
+
+        The message is encoded once and the sends run concurrently.
+
+        Args:
+            user_ids: Recipients; users without a connection are skipped
+            message: JSON-serializable payload
+        """
+        targets = [
+            (uid, ws)
+            for uid in {str(u) for u in user_ids}
+            for ws in self.active.get(uid, ())
+        ]
+        if targets:
+            await self._send_all(targets, self._encode(message))
+
+    @staticmethod
+    def _encode(message: dict) -> str:
+        # Clients expect text frames, so the orjson bytes are decoded once here
+        return orjson.dumps(message).decode()
+
+    async def _send_all(self, targets: List[Tuple[str, WebSocket]], data: str):
+        # Send concurrently so one slow client does not hold up the others
+        results = await asyncio.gather(*(ws.send_text(data) for _, ws in targets), return_exceptions=True)
+        dead: Dict[str, List[WebSocket]] = {}
+        for (uid, ws), result in zip(targets, results):
+            if isinstance(result, Exception):
+                dead.setdefault(uid, []).append(ws)
+        for uid, sockets in dead.items():
+            await self._prune(uid, sockets)
+
+    async def _prune(self, user_id: str, dead):
+        """Forget broken sockets and close them."""
+        async with self.lock:
+            conns = self.active.get(user_id)
+            if conns is not None:
+                conns.difference_update(dead)
+                if not conns:
+                    self.active.pop(user_id, None)
+        for ws in dead:
             try:
-                await ws.send_text(data)
+                await ws.close()
             except Exception:
-                # ignore broken sockets
-                try:
-                    await ws.close()
-                except Exception:
-                    pass
+                pass
 
 manager = ConnectionManager()
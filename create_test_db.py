@@ -16,7 +16,10 @@ DB_PORT = int(os.getenv("DB_PORT", "5432"))
 DB_NAME = os.getenv("TEST_DB_NAME", "communityhub_test")
 
 async def create_database():
-    """Create the test database if it doesn't exist."""
+    """
+    Create the test database if it doesn't exist.
+    Returns True if it was created, False if it already existed, None on error.
+    """
     # Connect to the default 'postgres' database to create our test database
     try:
         conn = await asyncpg.connect(
@@ -33,7 +36,8 @@ async def create_database():
             DB_NAME
         )
         
-        if not exists:
+        created = not exists
+        if created:
             # Create the database
             await conn.execute(f'CREATE DATABASE {DB_NAME}')
             print(f"✅ Database '{DB_NAME}' created successfully")
@@ -44,12 +48,16 @@ async def create_database():
         
     except Exception as e:
         print(f"❌ Error creating database: {e}")
-        return False
+        return None
     
-    return True
+    return created
 
-async def create_tables():
-    """Create all tables in the test database."""
+async def create_tables(fresh: bool = False):
+    """
+    Create all tables in the test database.
+    A freshly created database is known to be empty, so the per-table
+    existence checks are skipped and only the CREATE statements are sent.
+    """
     try:
         # Create engine for the test database
         engine = create_async_engine(
@@ -59,7 +67,7 @@ async def create_tables():
         
         # Create all tables
         async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(Base.metadata.create_all, checkfirst=not fresh)
         
         print("✅ Tables created successfully")
         await engine.dispose()
@@ -75,10 +83,11 @@ async def main():
     print("🔧 Setting up test database...")
     print()
     
-    if not await create_database():
+    created = await create_database()
+    if created is None:
         return
     
-    if not await create_tables():
+    if not await create_tables(fresh=created):
         return
     
     print()
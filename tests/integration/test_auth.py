@@ -5,9 +5,10 @@ Tests register, login, refresh, and logout functionality with real database.
 import pytest
 from httpx import AsyncClient
 
+from app.db.models.user import RoleEnum
+
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 class TestAuthEndpoints:
     """Test authentication API endpoints."""
     
@@ -185,7 +186,6 @@ class TestAuthEndpoints:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 class TestProtectedEndpoints:
     """Test accessing protected endpoints with authentication."""
     
@@ -235,6 +235,27 @@ class TestProtectedEndpoints:
         
         assert response.status_code == 403
     
+    async def test_role_change_applies_to_cached_token(
+        self, client: AsyncClient, db_session, user_token, test_user, mock_publish_event
+    ):
+        """Test that promoting a user takes effect on a token already in the auth cache."""
+        event_payload = {
+            "title": "Test Event",
+            "description": "Test description",
+            "location": "Test location",
+            "capacity": 50
+        }
+        headers = {"Authorization": f"Bearer {user_token}"}
+        
+        response = await client.post("/api/v1/events/", headers=headers, json=event_payload)
+        assert response.status_code == 403
+        
+        test_user.role = RoleEnum.organizer
+        await db_session.commit()
+        
+        response = await client.post("/api/v1/events/", headers=headers, json=event_payload)
+        assert response.status_code == 200
+    
     async def test_organizer_only_endpoint_as_organizer(
         self, client: AsyncClient, organizer_token, mock_publish_event
     ):
@@ -6,9 +6,10 @@ import pytest
 from httpx import AsyncClient
 from datetime import datetime, timedelta
 
+from app.db.models import EventCategory
+
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 class TestEventEndpoints:
     """Test event API endpoints."""
     
@@ -35,6 +36,25 @@ class TestEventEndpoints:
         assert data["category"] == "technology"
         assert "id" in data
     
+    async def test_timestamps_match_between_create_and_reads(
+        self, client: AsyncClient, organizer_token, mock_publish_event
+    ):
+        """Test that GET endpoints format timestamps exactly like the POST response."""
+        response = await client.post(
+            "/api/v1/events/",
+            headers={"Authorization": f"Bearer {organizer_token}"},
+            json={"title": "Timestamp Check", "starts_at": "2030-06-01T18:30:00Z", "capacity": 10}
+        )
+        assert response.status_code == 200
+        created = response.json()
+        assert created["starts_at"] == "2030-06-01T18:30:00Z"
+        
+        detail = (await client.get(f"/api/v1/events/{created['id']}")).json()
+        listed = (await client.get("/api/v1/events/", params={"title": "Timestamp Check"})).json()
+        
+        assert detail["starts_at"] == created["starts_at"]
+        assert [e["starts_at"] for e in listed["items"]] == [created["starts_at"]]
+    
     async def test_create_event_as_user_fails(
         self, client: AsyncClient, user_token
     ):
@@ -97,33 +117,24 @@ class TestEventEndpoints:
         # Verify different events
         assert data1["items"][0]["id"] != data2["items"][0]["id"]
     
-    async def test_list_events_filter_by_category(
-        self, client: AsyncClient, organizer_token, mock_publish_event
-    ):
+    async def test_list_events_filter_by_category(self, client: AsyncClient, make_events):
         """Test filtering events by category."""
         # Create events with different categories
-        await client.post(
-            "/api/v1/events/",
-            headers={"Authorization": f"Bearer {organizer_token}"},
-            json={
+        await make_events(
+            {
                 "title": "Tech Event",
                 "description": "Tech desc",
                 "location": "Location",
                 "capacity": 50,
-                "category": "technology"
-            }
-        )
-        
-        await client.post(
-            "/api/v1/events/",
-            headers={"Authorization": f"Bearer {organizer_token}"},
-            json={
+                "category": EventCategory.technology
+            },
+            {
                 "title": "Sports Event",
                 "description": "Sports desc",
                 "location": "Stadium",
                 "capacity": 100,
-                "category": "sports"
-            }
+                "category": EventCategory.sports
+            },
         )
         
         # Filter by technology category
@@ -131,23 +142,18 @@ class TestEventEndpoints:
         assert response.status_code == 200
         data = response.json()
         events = data["items"]
-        assert all(e["category"] == "technology" for e in events if e.get("category"))
+        assert [e["title"] for e in events] == ["Tech Event"]
+        assert all(e["category"] == "technology" for e in events)
     
-    async def test_list_events_search(
-        self, client: AsyncClient, organizer_token, mock_publish_event
-    ):
+    async def test_list_events_search(self, client: AsyncClient, make_events):
         """Test full-text search on events."""
         # Create event with specific keywords
-        await client.post(
-            "/api/v1/events/",
-            headers={"Authorization": f"Bearer {organizer_token}"},
-            json={
-                "title": "Python Workshop",
-                "description": "Learn Python programming",
-                "location": "Tech Center",
-                "capacity": 30
-            }
-        )
+        await make_events({
+            "title": "Python Workshop",
+            "description": "Learn Python programming",
+            "location": "Tech Center",
+            "capacity": 30
+        })
         
         # Search for "python"
         response = await client.get("/api/v1/events/?search=python")
@@ -170,6 +176,36 @@ class TestEventEndpoints:
         assert data["title"] == test_event.title
         assert "available_spots" in data
     
+    async def test_get_event_detail_etag(self, client: AsyncClient, test_event):
+        """Test that event detail sets cache validators and honours If-None-Match."""
+        response = await client.get(f"/api/v1/events/{test_event.id}")
+        
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert "max-age" in response.headers["cache-control"]
+        
+        cached = await client.get(
+            f"/api/v1/events/{test_event.id}",
+            headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
+    
+    async def test_list_events_etag_changes_with_content(
+        self, client: AsyncClient, test_events
+    ):
+        """Test that the list ETag differs between different pages."""
+        response1 = await client.get("/api/v1/events/?page=1&per_page=2")
+        response2 = await client.get("/api/v1/events/?page=2&per_page=2")
+        
+        assert response1.headers["etag"] != response2.headers["etag"]
+        
+        stale = await client.get(
+            "/api/v1/events/?page=1&per_page=2",
+            headers={"If-None-Match": response2.headers["etag"]}
+        )
+        assert stale.status_code == 200
+    
     async def test_get_event_not_found(self, client: AsyncClient):
         """Test getting non-existent event returns 404."""
         from uuid import uuid4
@@ -192,7 +228,6 @@ class TestEventEndpoints:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 class TestEventCapacity:
     """Test event capacity management."""
     
@@ -225,13 +260,30 @@ class TestEventCapacity:
         
         assert rsvp_response.status_code == 200
     
+    async def test_rsvp_updates_cached_event_detail(
+        self, client: AsyncClient, user_token, test_event, mock_publish_event
+    ):
+        """Test that an RSVP invalidates the cached event detail."""
+        # First read populates the detail cache
+        before = await client.get(f"/api/v1/events/{test_event.id}")
+        assert before.status_code == 200
+        
+        rsvp_response = await client.post(
+            "/api/v1/rsvps/",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={"event_id": str(test_event.id), "status": "going"}
+        )
+        assert rsvp_response.status_code == 200
+        
+        after = await client.get(f"/api/v1/events/{test_event.id}")
+        assert after.status_code == 200
+        assert after.json()["available_spots"] == before.json()["available_spots"] - 1
+        assert after.headers["etag"] != before.headers["etag"]
+    
     async def test_rsvp_to_full_event_fails(
-        self, client: AsyncClient, organizer_token, db_session, mock_publish_event
+        self, client: AsyncClient, organizer_token, make_users, mock_publish_event
     ):
         """Test RSVPing to full event fails."""
-        from app.db.models import User, RoleEnum
-        from app.core.security import hash_password, create_access_token
-        
         # Create event with capacity of 1
         event_response = await client.post(
             "/api/v1/events/",
@@ -245,19 +297,10 @@ class TestEventCapacity:
         )
         event = event_response.json()
         
-        # Create first user and RSVP
-        user1 = User(
-            email="user1@example.com",
-            hashed_password=hash_password("Test123!@#"),
-            full_name="User 1",
-            role=RoleEnum.user
-        )
-        db_session.add(user1)
-        await db_session.commit()
-        await db_session.refresh(user1)
-        
-        token1 = create_access_token({"sub": str(user1.id), "role": "user"})
+        # Create both users in one insert
+        (_, token1), (_, token2) = await make_users("user1@example.com", "user2@example.com")
         
+        # First user takes the only spot
         rsvp1_response = await client.post(
             "/api/v1/rsvps/",
             headers={"Authorization": f"Bearer {token1}"},
@@ -265,19 +308,7 @@ class TestEventCapacity:
         )
         assert rsvp1_response.status_code == 200
         
-        # Create second user and try to RSVP (should fail)
-        user2 = User(
-            email="user2@example.com",
-            hashed_password=hash_password("Test123!@#"),
-            full_name="User 2",
-            role=RoleEnum.user
-        )
-        db_session.add(user2)
-        await db_session.commit()
-        await db_session.refresh(user2)
-        
-        token2 = create_access_token({"sub": str(user2.id), "role": "user"})
-        
+        # Second user tries to RSVP (should fail)
         rsvp2_response = await client.post(
             "/api/v1/rsvps/",
             headers={"Authorization": f"Bearer {token2}"},
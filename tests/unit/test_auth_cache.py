@@ -0,0 +1,136 @@
+"""
+Unit tests for the per-process authenticated user cache.
+"""
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app import auth
+from app.auth import AuthUser, forget_user, get_authed, listen_for_revocations, token_cache_key
+from app.core.security import create_access_token
+from app.db.models.user import User, RoleEnum
+
+
+def make_user(role: RoleEnum = RoleEnum.user) -> User:
+    return User(id=uuid.uuid4(), email=f"{uuid.uuid4().hex}@example.com", full_name="Test User", role=role)
+
+
+class EvictingSession:
+    """Session stand-in that runs an eviction while the user lookup is in flight."""
+    
+    def __init__(self, user: User, evict):
+        self.user = user
+        self.evict = evict
+    
+    async def get(self, model, user_id):
+        self.evict()
+        return self.user
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    """Poll until condition() is true or fail after timeout seconds."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not await condition():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    auth._user_cache.clear()
+    yield
+    auth._user_cache.clear()
+
+
+@pytest.mark.unit
+class TestAuthUserCache:
+    """Test what the auth cache stores and when it is evicted."""
+    
+    def test_snapshot_is_detached_from_orm_instance(self):
+        """Test that the cached snapshot does not follow later ORM changes."""
+        user = make_user()
+        snapshot = AuthUser.from_user(user)
+        
+        user.role = RoleEnum.admin
+        
+        assert snapshot.role == "user"
+        assert not isinstance(snapshot, User)
+        with pytest.raises(AttributeError):
+            snapshot.role = RoleEnum.admin
+    
+    async def test_forget_user_evicts_every_token(self, fake_redis):
+        """Test that forgetting a user drops all of their tokens and nobody else's."""
+        alice, bob = AuthUser.from_user(make_user()), AuthUser.from_user(make_user())
+        auth._user_cache.set("alice-phone", alice)
+        auth._user_cache.set("alice-laptop", alice)
+        auth._user_cache.set("bob", bob)
+        
+        await forget_user(alice.id)
+        
+        assert auth._user_cache.get("alice-phone") is None
+        assert auth._user_cache.get("alice-laptop") is None
+        assert auth._user_cache.get("bob") == bob
+    
+    def test_commit_hook_evicts_changed_users(self):
+        """Test that users collected during a flush are evicted on commit only."""
+        changed = AuthUser.from_user(make_user())
+        auth._user_cache.set("changed", changed)
+        session = SimpleNamespace(info={auth._CHANGED_USERS_KEY: {changed.id}})
+        
+        auth._discard_changed_users(session)
+        assert auth._user_cache.get("changed") == changed
+        
+        session.info[auth._CHANGED_USERS_KEY] = {changed.id}
+        auth._evict_changed_users(session)
+        assert auth._user_cache.get("changed") is None
+    
+    @pytest.mark.parametrize("evict", ["token", "user"])
+    async def test_eviction_during_lookup_is_not_undone(self, fake_redis, evict):
+        """Test that a lookup racing an eviction does not re-cache its result."""
+        user = make_user()
+        token = create_access_token({"sub": str(user.id)})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        if evict == "token":
+            session = EvictingSession(user, lambda: auth._evict_token_key(token_cache_key(token)))
+        else:
+            session = EvictingSession(user, lambda: auth._evict_user(user.id))
+        
+        authed_user, _ = await get_authed(credentials, session)
+        
+        assert authed_user.id == user.id
+        assert auth._user_cache.get(token_cache_key(token)) is None
+        
+        # Without a racing eviction the next lookup is cached again
+        session.evict = lambda: None
+        await get_authed(credentials, session)
+        assert auth._user_cache.get(token_cache_key(token)) is not None
+    
+    async def test_listener_applies_announced_evictions(self, fake_redis):
+        """Test that token and user announcements evict entries on this worker."""
+        listener = asyncio.create_task(listen_for_revocations())
+        
+        async def subscribed():
+            return (await fake_redis.pubsub_numsub(auth.REVOCATION_CHANNEL))[0][1] > 0
+        
+        try:
+            await wait_for(subscribed)
+            alice, bob = AuthUser.from_user(make_user()), AuthUser.from_user(make_user())
+            auth._user_cache.set("alice-token", alice)
+            auth._user_cache.set("bob-phone", bob)
+            auth._user_cache.set("bob-laptop", bob)
+            
+            await fake_redis.publish(auth.REVOCATION_CHANNEL, "alice-token")
+            await fake_redis.publish(auth.REVOCATION_CHANNEL, f"user:{bob.id}")
+            
+            async def evicted():
+                return all(auth._user_cache.get(k) is None for k in ("alice-token", "bob-phone", "bob-laptop"))
+            
+            await wait_for(evicted)
+        finally:
+            listener.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await listener
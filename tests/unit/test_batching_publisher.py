@@ -0,0 +1,118 @@
+"""
+Unit tests for the batching event publisher.
+"""
+import asyncio
+
+import pytest
+
+from app.events.batching_publisher import BatchPublisher
+
+
+class FakeSend:
+    """Records published batches; fails the first `failures` calls."""
+    
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.calls = 0
+        self.batches = []
+    
+    async def __call__(self, batch):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("broker unavailable")
+        self.batches.append([routing_key for routing_key, _ in batch])
+
+
+def make_publisher(send: FakeSend, **kwargs) -> BatchPublisher:
+    kwargs.setdefault("flush_interval", 10)
+    kwargs.setdefault("retry_delay", 0)
+    return BatchPublisher(send, **kwargs)
+
+
+@pytest.mark.unit
+class TestBatchPublisher:
+    """Test batching, shutdown and broker failure handling."""
+    
+    async def test_flusher_starts_lazily(self):
+        """Test that no task runs until the first event is queued."""
+        publisher = make_publisher(FakeSend())
+        assert publisher._task is None
+        
+        await publisher.close()  # Nothing to do before the first event
+        await publisher.enqueue("event.created", {})
+        
+        assert publisher._task is not None and not publisher._task.done()
+        await publisher.close()
+    
+    async def test_close_drains_partial_batch(self):
+        """Test that close() publishes a batch still waiting on its interval and stops."""
+        send = FakeSend()
+        publisher = make_publisher(send)
+        await publisher.enqueue("a", {})
+        await publisher.enqueue("b", {})
+        
+        # The stop sentinel lands mid-batch, long before the 10 s interval
+        await asyncio.wait_for(publisher.close(), 1)
+        
+        assert send.batches == [["a", "b"]]
+        assert publisher._task is None
+    
+    async def test_batches_are_capped_at_max_batch(self):
+        """Test that a burst is split into batches of at most max_batch events."""
+        send = FakeSend()
+        publisher = make_publisher(send, max_batch=3)
+        for key in "abcdefg":
+            await publisher.enqueue(key, {})
+        
+        await publisher.close()
+        
+        assert send.batches == [["a", "b", "c"], ["d", "e", "f"], ["g"]]
+    
+    async def test_batch_is_sent_after_flush_interval(self):
+        """Test that a quiet queue is flushed once the interval passes."""
+        send = FakeSend()
+        publisher = make_publisher(send, flush_interval=0.01)
+        await publisher.enqueue("a", {})
+        await asyncio.sleep(0.05)
+        
+        assert send.batches == [["a"]]
+        
+        await publisher.enqueue("b", {})
+        await publisher.close()
+        assert send.batches == [["a"], ["b"]]
+    
+    async def test_failed_batch_is_retried(self):
+        """Test that a batch rejected by the broker is published on retry."""
+        send = FakeSend(failures=2)
+        publisher = make_publisher(send, retries=2)
+        await publisher.enqueue("a", {})
+        
+        await publisher.close()
+        
+        assert send.calls == 3
+        assert send.batches == [["a"]]
+    
+    async def test_batch_is_dropped_after_retries(self):
+        """Test that a batch is given up after its retries and later batches still go out."""
+        send = FakeSend(failures=2)
+        publisher = make_publisher(send, max_batch=1, retries=1)
+        await publisher.enqueue("a", {})
+        await publisher.enqueue("b", {})
+        
+        await publisher.close()
+        
+        assert send.batches == [["b"]]
+    
+    async def test_full_queue_drops_new_events(self):
+        """Test that events beyond max_queued are dropped instead of growing memory."""
+        send = FakeSend()
+        publisher = make_publisher(send, max_queued=2)
+        
+        # The flusher cannot run between these calls, so the queue fills up
+        for key in "abc":
+            await publisher.enqueue(key, {})
+        assert publisher._dropped == 1
+        
+        await publisher.close()
+        
+        assert send.batches == [["a", "b"]]
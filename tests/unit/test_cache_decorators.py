@@ -0,0 +1,93 @@
+"""
+Unit tests for cache key generation in the cached() decorator.
+"""
+import inspect
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache.cache_decorators import cached, _generate_key_from_args
+from app.cache.redis_client import cache
+from app.db.models.event import EventCategory
+
+
+async def list_things(
+    db,
+    limit: int = 20,
+    created_by: Optional[str] = None,
+    category: Optional[str] = None,
+    starts_after: Optional[datetime] = None
+):
+    return []
+
+
+SIGNATURE = inspect.signature(list_things)
+
+
+def key_for(*args, **kwargs) -> str:
+    return _generate_key_from_args(SIGNATURE, args, kwargs)
+
+
+@pytest.mark.unit
+class TestCacheKeyGeneration:
+    """Test that equivalent calls share a key and different calls do not."""
+    
+    def test_positional_keyword_and_default_arguments_match(self):
+        """Test that how an argument is passed does not change the key."""
+        db = AsyncSession()
+        
+        assert key_for(db) == key_for(db, 20) == key_for(db, limit=20) == key_for(db, 20, None)
+        assert key_for(db) != key_for(db, 21)
+    
+    def test_session_is_ignored(self):
+        """Test that calls from different sessions share a key."""
+        assert key_for(AsyncSession(), 10) == key_for(AsyncSession(), 10)
+    
+    def test_uuid_and_string_match(self):
+        """Test that a UUID and its string form give the same key."""
+        user_id = uuid.uuid4()
+        
+        assert key_for(None, created_by=user_id) == key_for(None, created_by=str(user_id))
+        assert key_for(None, created_by=user_id) != key_for(None, created_by=str(uuid.uuid4()))
+    
+    def test_enum_and_value_match(self):
+        """Test that an enum member and its value give the same key."""
+        assert key_for(None, category=EventCategory.technology) == key_for(None, category="technology")
+        assert key_for(None, category=EventCategory.technology) != key_for(None, category="music")
+    
+    def test_none_differs_from_string_none(self):
+        """Test that a missing filter and the literal string "None" do not collide."""
+        assert key_for(None, created_by=None) != key_for(None, created_by="None")
+    
+    def test_datetime_is_keyed_by_isoformat(self):
+        """Test that equal datetimes share a key and different ones do not."""
+        when = datetime(2030, 6, 1, 18, 30, tzinfo=timezone.utc)
+        
+        assert key_for(None, starts_after=when) == key_for(None, starts_after=when.replace())
+        assert key_for(None, starts_after=when) != key_for(None, starts_after=when.replace(hour=19))
+
+
+@pytest.mark.unit
+class TestCachedKeyParam:
+    """Test the predictable keys produced by key_param."""
+    
+    async def test_key_param_produces_exact_key(self, fake_redis):
+        """Test that key_param stores under <prefix>:<value> for UUID and string ids."""
+        calls = []
+        
+        @cached('events:detail', expire=60, key_param='event_id')
+        async def get_thing(db, event_id):
+            calls.append(event_id)
+            return {"id": str(event_id)}
+        
+        event_id = uuid.uuid4()
+        await get_thing(AsyncSession(), event_id)
+        
+        assert [k.decode() for k in await fake_redis.keys()] == [cache._key(f"events:detail:{event_id}")]
+        
+        # A string id and a keyword call hit the same entry
+        assert await get_thing(AsyncSession(), event_id=str(event_id)) == {"id": str(event_id)}
+        assert calls == [event_id]
@@ -0,0 +1,85 @@
+"""
+Unit tests for the Redis cache storage format.
+"""
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from app.cache.redis_client import cache
+from app.core.config import settings
+
+# Compresses well and serializes to well over the default threshold
+LARGE_VALUE = {"items": [{"id": i, "title": "Community meetup"} for i in range(100)]}
+SMALL_VALUE = {"id": 1, "title": "Community meetup"}
+
+
+@pytest.fixture
+def compression_threshold(monkeypatch):
+    """Set CACHE_COMPRESSION_THRESHOLD for one test."""
+    def _set(value: int):
+        monkeypatch.setattr(settings, "CACHE_COMPRESSION_THRESHOLD", value)
+    return _set
+
+
+@pytest.mark.unit
+class TestCacheStorageFormat:
+    """Test that every payload branch round-trips through Redis."""
+    
+    async def test_small_value_is_stored_raw(self, fake_redis, compression_threshold):
+        """Test that values under the threshold get the R marker and plain JSON."""
+        compression_threshold(1024)
+        await cache.set("small", SMALL_VALUE)
+        
+        stored = await fake_redis.get(cache._key("small"))
+        assert stored[:1] == b"R"
+        assert json.loads(stored[1:]) == SMALL_VALUE
+        assert await cache.get("small") == SMALL_VALUE
+    
+    async def test_large_value_is_compressed(self, fake_redis, compression_threshold):
+        """Test that values over the threshold get the Z marker and zstd body."""
+        compression_threshold(1024)
+        await cache.set("large", LARGE_VALUE)
+        
+        stored = await fake_redis.get(cache._key("large"))
+        assert stored[:1] == b"Z"
+        assert len(stored) < len(json.dumps(LARGE_VALUE))
+        assert await cache.get("large") == LARGE_VALUE
+    
+    async def test_zero_threshold_disables_compression(self, fake_redis, compression_threshold):
+        """Test that a threshold of 0 stores even large values raw."""
+        compression_threshold(0)
+        await cache.set("large", LARGE_VALUE)
+        
+        stored = await fake_redis.get(cache._key("large"))
+        assert stored[:1] == b"R"
+        assert await cache.get("large") == LARGE_VALUE
+    
+    @pytest.mark.parametrize("value", [SMALL_VALUE, [1, 2, 3], "text", 42, True])
+    async def test_legacy_unmarked_json_is_read(self, fake_redis, value):
+        """Test that entries written before payload markers still decode."""
+        await fake_redis.set(cache._key("legacy"), json.dumps(value))
+        
+        assert await cache.get("legacy") == value
+    
+    async def test_orjson_native_types(self, fake_redis):
+        """Test how UUIDs, datetimes and other objects are stored."""
+        event_id = uuid.uuid4()
+        value = {
+            "id": event_id,
+            "naive": datetime(2030, 6, 1, 18, 30),
+            "aware": datetime(2030, 6, 1, 18, 30, tzinfo=timezone.utc),
+            "price": Decimal("1.50"),
+        }
+        await cache.set("typed", value)
+        
+        assert await cache.get("typed") == {
+            "id": str(event_id),
+            # Naive datetimes are taken to be UTC
+            "naive": "2030-06-01T18:30:00+00:00",
+            "aware": "2030-06-01T18:30:00+00:00",
+            # Types orjson cannot encode fall back to str()
+            "price": "1.50",
+        }
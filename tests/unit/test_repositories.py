@@ -12,6 +12,7 @@ from app.db.repositories import (
     get_user,
     create_event,
     list_events,
+    list_events_with_total,
     get_event,
     get_event_rsvp_count,
     create_rsvp,
@@ -22,7 +23,6 @@ from app.db.models import User, Event, RSVP, RoleEnum, RSVPStatusEnum
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 class TestUserRepository:
     """Test user repository functions."""
     
@@ -42,6 +42,18 @@ class TestUserRepository:
         assert user.role == RoleEnum.user
         assert user.hashed_password != "Test123!@#"  # Should be hashed
     
+    async def test_create_user_duplicate_email(self, db_session, test_user):
+        """Test creating a user with a registered email returns None."""
+        user_data = UserCreate(
+            email=test_user.email,
+            password="Test123!@#",
+            full_name="Duplicate User"
+        )
+        
+        user = await create_user(db_session, user_data)
+        
+        assert user is None
+    
     async def test_get_user_by_email(self, db_session, test_user):
         """Test retrieving user by email."""
         user = await get_user_by_email(db_session, test_user.email)
@@ -73,7 +85,6 @@ class TestUserRepository:
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 class TestEventRepository:
     """Test event repository functions."""
     
@@ -118,9 +129,9 @@ class TestEventRepository:
     
     async def test_list_events_filter_by_date_range(self, db_session, test_events):
         """Test filtering events by date range."""
-        now = datetime.utcnow()
-        after = now + timedelta(days=2)
-        before = now + timedelta(days=4)
+        # Bounds come from the fixture rows, so the result does not depend on the clock
+        after = test_events[1].starts_at
+        before = test_events[3].starts_at
         
         events = await list_events(
             db_session,
@@ -128,8 +139,52 @@ class TestEventRepository:
             starts_before=before
         )
         
-        # Should get events that start between day 2 and day 4
-        assert len(events) >= 1
+        # Both bounds are inclusive: the events starting on day 2, 3 and 4
+        assert {e['id'] for e in events} == {str(e.id) for e in test_events[1:4]}
+    
+    async def test_list_events_filter_by_title_substring(self, db_session, test_events):
+        """Test case-insensitive substring filtering on title."""
+        events = await list_events(db_session, title_contains="EVENT 3")
+        
+        assert len(events) == 1
+        assert events[0]['title'] == "Event 3"
+    
+    async def test_list_events_with_total(self, db_session, test_events):
+        """Test listing a page of events together with the total count."""
+        page = await list_events_with_total(db_session, limit=2, offset=0)
+        
+        assert page['total'] == len(test_events)
+        assert len(page['items']) == 2
+    
+    async def test_list_events_with_total_past_last_page(self, db_session, test_events):
+        """Test that an empty page past the end still reports the total."""
+        page = await list_events_with_total(db_session, limit=2, offset=10)
+        
+        assert page['total'] == len(test_events)
+        assert page['items'] == []
+    
+    async def test_search_uses_gin_index(self, db_session, test_events):
+        """Test that the search predicate is eligible for idx_event_search_tsv."""
+        from sqlalchemy import select, text
+        from sqlalchemy.dialects import postgresql
+        from app.db.repositories import _apply_event_filters
+        
+        q = _apply_event_filters(select(Event.id), search="event")
+        sql = str(q.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        
+        # Tiny tables always favour a seq scan, so rule it out to check eligibility
+        await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        res = await db_session.execute(text(f"EXPLAIN {sql}"))
+        plan = "\n".join(row[0] for row in res)
+        
+        assert "idx_event_search_tsv" in plan
+    
+    async def test_list_events_search_web_syntax(self, db_session, test_events):
+        """Test that search accepts web-style syntax such as negated terms."""
+        events = await list_events(db_session, search="event -3")
+        
+        assert len(events) == 4
+        assert all(e['title'] != "Event 3" for e in events)
     
     async def test_get_event(self, db_session, test_event):
         """Test retrieving a single event."""
@@ -148,7 +203,6 @@ class TestEventRepository:
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 class TestRSVPRepository:
     """Test RSVP repository functions."""
     
@@ -166,6 +220,19 @@ class TestRSVPRepository:
         assert rsvp.event_id == test_event.id
         assert rsvp.status == RSVPStatusEnum.going
     
+    async def test_create_rsvp_duplicate(self, db_session, test_user, test_event):
+        """Test a second RSVP for the same user and event is rejected."""
+        rsvp_data = RSVPCreate(
+            event_id=test_event.id,
+            status="going"
+        )
+        await create_rsvp(db_session, test_user.id, rsvp_data)
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await create_rsvp(db_session, test_user.id, rsvp_data)
+        
+        assert exc_info.value.status_code == 409
+    
     async def test_create_rsvp_event_not_found(self, db_session, test_user):
         """Test creating RSVP for non-existent event raises error."""
         from uuid import uuid4
@@ -181,7 +248,7 @@ class TestRSVPRepository:
         assert exc_info.value.status_code == 404
         assert "Event not found" in str(exc_info.value.detail)
     
-    async def test_create_rsvp_exceeds_capacity(self, db_session, test_user, test_organizer):
+    async def test_create_rsvp_exceeds_capacity(self, db_session, test_user, test_organizer, make_users):
         """Test creating RSVP when event is at capacity."""
         # Create event with capacity of 1
         event_data = EventCreate(
@@ -198,15 +265,7 @@ class TestRSVPRepository:
         await create_rsvp(db_session, test_user.id, rsvp_data1)
         
         # Create second user and try to RSVP (should fail)
-        user2 = User(
-            email="user2@example.com",
-            hashed_password="hashed",
-            full_name="User 2",
-            role=RoleEnum.user
-        )
-        db_session.add(user2)
-        await db_session.commit()
-        await db_session.refresh(user2)
+        [(user2, _)] = await make_users("user2@example.com")
         
         rsvp_data2 = RSVPCreate(event_id=event.id, status="going")
         
@@ -232,6 +291,21 @@ class TestRSVPRepository:
         
         assert count == 0  # 'interested' should not be counted
     
+    async def test_rsvp_going_count_follows_status(self, db_session, test_event, test_rsvp):
+        """Test that the trigger-maintained going count tracks status changes."""
+        from sqlalchemy import select
+        
+        going_count = select(Event.rsvp_going_count).where(Event.id == test_event.id)
+        assert await db_session.scalar(going_count) == 1
+        
+        test_rsvp.status = RSVPStatusEnum.cancelled
+        await db_session.commit()
+        assert await db_session.scalar(going_count) == 0
+        
+        await db_session.delete(test_rsvp)
+        await db_session.commit()
+        assert await db_session.scalar(going_count) == 0
+    
     async def test_list_rsvps_for_event(self, db_session, test_event, test_rsvp):
         """Test listing RSVPs for an event."""
         rsvps = await list_rsvps_for_event(db_session, str(test_event.id))
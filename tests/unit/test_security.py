@@ -4,12 +4,14 @@ Tests password validation, hashing, JWT token creation/validation, and token rev
 """
 import pytest
 from datetime import timedelta
-from jose import jwt, JWTError
+import jwt
 
 from app.core.security import (
     validate_password,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_and_update_password_async,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -18,46 +20,36 @@ from app.core.security import (
 )
 from app.core.config import settings
 
+# Signing key and algorithm list shared by the raw PyJWT calls below
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHMS = ["HS256"]
+
 
 @pytest.mark.unit
 class TestPasswordValidation:
     """Test password validation functionality."""
     
-    def test_valid_password(self):
+    @pytest.mark.parametrize("password", [
+        "Test123!@#",
+        "MyP@ssw0rd",
+        "Secur3#Pass",
+        "Admin2024!",
+    ])
+    def test_valid_password(self, password):
         """Test that valid passwords pass validation."""
-        valid_passwords = [
-            "Test123!@#",
-            "MyP@ssw0rd",
-            "Secur3#Pass",
-            "Admin2024!",
-        ]
-        for password in valid_passwords:
-            validate_password(password)  # Should not raise
-    
-    def test_password_too_short(self):
-        """Test that short passwords are rejected."""
-        with pytest.raises(ValueError, match="at least 8 characters"):
-            validate_password("Test1!")
-    
-    def test_password_no_uppercase(self):
-        """Test that passwords without uppercase are rejected."""
-        with pytest.raises(ValueError, match="uppercase letter"):
-            validate_password("test123!@#")
-    
-    def test_password_no_lowercase(self):
-        """Test that passwords without lowercase are rejected."""
-        with pytest.raises(ValueError, match="lowercase letter"):
-            validate_password("TEST123!@#")
-    
-    def test_password_no_digit(self):
-        """Test that passwords without digits are rejected."""
-        with pytest.raises(ValueError, match="digit"):
-            validate_password("TestPass!@#")
-    
-    def test_password_no_special_char(self):
-        """Test that passwords without special characters are rejected."""
-        with pytest.raises(ValueError, match="special character"):
-            validate_password("TestPass123")
+        validate_password(password)  # Should not raise
+    
+    @pytest.mark.parametrize("password, match", [
+        pytest.param("Test1!", "at least 8 characters", id="too_short"),
+        pytest.param("test123!@#", "uppercase letter", id="no_uppercase"),
+        pytest.param("TEST123!@#", "lowercase letter", id="no_lowercase"),
+        pytest.param("TestPass!@#", "digit", id="no_digit"),
+        pytest.param("TestPass123", "special character", id="no_special_char"),
+    ])
+    def test_invalid_password(self, password, match):
+        """Test that passwords missing a required character class are rejected."""
+        with pytest.raises(ValueError, match=match):
+            validate_password(password)
 
 
 @pytest.mark.unit
@@ -80,6 +72,13 @@ class TestPasswordHashing:
         
         assert verify_password(password, hashed) is True
     
+    async def test_async_hashing_round_trip(self):
+        """Test that the thread pool helpers hash and verify like the sync ones."""
+        hashed = await hash_password_async("Test123!@#")
+        
+        assert verify_password("Test123!@#", hashed) is True
+        assert await verify_and_update_password_async("Test123!@#", hashed) == (True, None)
+    
     def test_verify_password_incorrect(self):
         """Test that incorrect passwords are rejected."""
         password = "Test123!@#"
@@ -120,7 +119,7 @@ class TestJWTTokens:
         assert len(token) > 0
         
         # Decode and verify
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=ALGORITHMS)
         assert payload["sub"] == "user123"
         assert payload["role"] == "user"
         assert payload["type"] == "access"
@@ -135,7 +134,7 @@ class TestJWTTokens:
         assert len(token) > 0
         
         # Decode and verify
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=ALGORITHMS)
         assert payload["sub"] == "user123"
         assert payload["type"] == "refresh"
         assert "exp" in payload
@@ -146,7 +145,7 @@ class TestJWTTokens:
         expires_delta = timedelta(minutes=5)
         token = create_access_token(data, expires_delta=expires_delta)
         
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=ALGORITHMS)
         assert "exp" in payload
     
     def test_decode_valid_token(self):
@@ -159,6 +158,16 @@ class TestJWTTokens:
         assert payload["role"] == "organizer"
         assert payload["type"] == "access"
     
+    def test_decode_token_repeat_returns_independent_copies(self):
+        """Test that repeat decodes of a token are not affected by caller mutation."""
+        token = create_access_token({"sub": "user123"})
+        
+        first = decode_token(token)
+        first["sub"] = "tampered"
+        
+        second = decode_token(token)
+        assert second["sub"] == "user123"
+    
     def test_decode_invalid_token(self):
         """Test that invalid tokens raise errors."""
         invalid_token = "invalid.token.here"
@@ -179,18 +188,17 @@ class TestJWTTokens:
         """Test that tokens without required fields raise errors."""
         # Create a token without 'sub' field
         payload = {"role": "user", "type": "access"}
-        token = jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
+        token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHMS[0])
         
         with pytest.raises(ValueError, match="Invalid token payload"):
             decode_token(token)
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("fake_redis")
 class TestTokenRevocation:
-    """Test token revocation functionality. Requires Redis."""
+    """Test token revocation functionality against an in-process fake Redis."""
     
-    @pytest.mark.skip(reason="Requires Redis to be running")
     async def test_revoke_token(self):
         """Test that tokens can be revoked."""
         token = "test_token_123"
@@ -209,7 +217,6 @@ class TestTokenRevocation:
         is_revoked = await is_token_revoked(token)
         assert is_revoked is False
     
-    @pytest.mark.skip(reason="Requires Redis to be running")
     async def test_revoke_and_check_multiple_tokens(self):
         """Test revoking multiple tokens."""
         tokens = ["token1", "token2", "token3"]
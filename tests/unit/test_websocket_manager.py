@@ -0,0 +1,72 @@
+"""
+Unit tests for the websocket connection manager.
+"""
+import pytest
+import orjson
+
+from app.websocket.manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a Starlette WebSocket."""
+    
+    def __init__(self, broken: bool = False):
+        self.broken = broken
+        self.sent = []
+        self.closed = False
+    
+    async def accept(self):
+        pass
+    
+    async def send_text(self, data: str):
+        if self.broken:
+            raise RuntimeError("connection lost")
+        self.sent.append(data)
+    
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.unit
+class TestConnectionManager:
+    """Test message delivery and dead connection pruning."""
+    
+    async def test_broadcast_delivers_once_per_connection(self):
+        """Test that broadcast reaches every connection of each listed user once."""
+        manager = ConnectionManager()
+        alice_phone, alice_laptop, bob = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        await manager.connect("alice", alice_phone)
+        await manager.connect("alice", alice_laptop)
+        await manager.connect("bob", bob)
+        
+        # Duplicate and unconnected ids are ignored
+        await manager.broadcast(["alice", "alice", "bob", "carol"], {"type": "event.created"})
+        
+        for ws in (alice_phone, alice_laptop, bob):
+            assert [orjson.loads(m) for m in ws.sent] == [{"type": "event.created"}]
+    
+    async def test_broadcast_prunes_dead_connections(self):
+        """Test that connections failing a send are closed and forgotten."""
+        manager = ConnectionManager()
+        healthy, dead, only_dead = FakeWebSocket(), FakeWebSocket(broken=True), FakeWebSocket(broken=True)
+        await manager.connect("alice", healthy)
+        await manager.connect("alice", dead)
+        await manager.connect("bob", only_dead)
+        
+        await manager.broadcast(["alice", "bob"], {"type": "ping"})
+        
+        assert len(healthy.sent) == 1
+        assert dead.closed and only_dead.closed
+        assert manager.active == {"alice": {healthy}}
+    
+    async def test_send_personal_message_prunes_dead_connections(self):
+        """Test that a personal message skips and removes a broken connection."""
+        manager = ConnectionManager()
+        healthy, dead = FakeWebSocket(), FakeWebSocket(broken=True)
+        await manager.connect("alice", healthy)
+        await manager.connect("alice", dead)
+        
+        await manager.send_personal_message("alice", {"type": "rsvp.confirmation"})
+        
+        assert [orjson.loads(m) for m in healthy.sent] == [{"type": "rsvp.confirmation"}]
+        assert manager.active == {"alice": {healthy}}